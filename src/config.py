@@ -1,17 +1,77 @@
+import logging
 import os
-from langchain_openai import ChatOpenAI
-from langchain.chat_models import init_chat_model
+from functools import lru_cache, partial
+from typing import Optional
+from langchain_core.language_models import BaseChatModel
+from langchain_core.globals import set_llm_cache
+from langchain_core.caches import InMemoryCache
+from langchain_core.runnables import Runnable
 # from langchain_azure import ChatAzure
 # from langchain_ollama import ChatOllama
 # from langchain_anthropic import ChatAnthropic
 # from langchain_google_genai import ChatGoogleGenerativeAI
 # from langchain_huggingface import HuggingFacePipeline, ChatHuggingFace
 
+logger = logging.getLogger(__name__)
+
+
+# LLM Response Cache
+# Identical prompts (re-runs on the same PDF, retries, tests) are answered from
+# the cache instead of the API. The roles run with temperature=0, so a cached
+# response is the same answer the model would give again.
+#   PDF_HUNTER_REDIS_URL       -> shared Redis cache (for distributed workers)
+#   PDF_HUNTER_LLM_CACHE       -> "sqlite" (default), "memory" or "none"
+#   PDF_HUNTER_LLM_CACHE_PATH  -> SQLite database path
+# The cache is installed when the first chat model is built, so importing
+# config neither loads langchain_community nor creates the SQLite file.
+@lru_cache(maxsize=None)
+def _configure_llm_cache():
+    """Install the process-wide LangChain LLM cache selected by the environment (once)."""
+    backend = os.getenv("PDF_HUNTER_LLM_CACHE", "sqlite").strip().lower()
+    redis_url = os.getenv("PDF_HUNTER_REDIS_URL")
+
+    try:
+        if redis_url:
+            import redis
+            from langchain_community.cache import RedisCache
+            set_llm_cache(RedisCache(redis_=redis.Redis.from_url(redis_url)))
+        elif backend == "memory":
+            set_llm_cache(InMemoryCache())
+        elif backend == "sqlite":
+            from langchain_community.cache import SQLiteCache
+            database_path = os.getenv("PDF_HUNTER_LLM_CACHE_PATH", ".pdf_hunter_llm_cache.db")
+            set_llm_cache(SQLiteCache(database_path=database_path))
+    except Exception as e:
+        logger.warning("LLM cache disabled: %s", e)
+
 
 # LLM Models
+# Clients are created on first use so importing config does not require
+# OPENAI_API_KEY or pay client construction cost.
+@lru_cache(maxsize=32)
+def build_chat_model(provider: str, model: str, **kwargs) -> BaseChatModel:
+    """
+    Return a chat model for (provider, model, kwargs), reusing the same
+    instance for identical arguments so roles share one client and its
+    connection pool.
+    """
+    _configure_llm_cache()
+    # Imported here so provider packages load on first model use, not at import
+    from langchain.chat_models import init_chat_model
+    return init_chat_model(model=model, model_provider=provider, **kwargs)
+
+
 # OpenAI
-openai_4o = ChatOpenAI(model="gpt-4o", temperature=0)
-openai_o3_mini = ChatOpenAI(model="o3-mini")
+def get_openai_4o() -> BaseChatModel:
+    """Return the shared gpt-4o client, creating it on first use."""
+    return build_chat_model("openai", "gpt-4o", temperature=0)
+
+
+def get_openai_o3_mini() -> BaseChatModel:
+    """Return the shared o3-mini client, creating it on first use."""
+    return build_chat_model("openai", "o3-mini")
+
+
 # openai_o3_mini = init_chat_model(
 #     model="o3-mini",
 #     temperature=0,
@@ -47,15 +107,80 @@ openai_o3_mini = ChatOpenAI(model="o3-mini")
 
 
 
+# Role Model Selection
+# Each role reads {ROLE}_PROVIDER and {ROLE}_MODEL from the environment, e.g.
+# STATIC_ANALYSIS_TRIAGE_MODEL=o3-mini or VISUAL_ANALYSIS_ANALYST_PROVIDER=anthropic.
+# init_chat_model only imports the provider package that is actually requested.
+DEFAULT_LLM_PROVIDER = "openai"
+DEFAULT_LLM_MODEL = "gpt-4o"
+
+
+def get_role_provider(role: str) -> str:
+    """Return the provider configured for a role."""
+    return os.getenv(f"{role}_PROVIDER", DEFAULT_LLM_PROVIDER)
+
+
+# Rate limits, timeouts and connection errors are retried by the provider
+# client with exponential backoff; PDF_HUNTER_LLM_MAX_RETRIES bounds it
+@lru_cache(maxsize=None)
+def _llm_max_retries() -> Optional[int]:
+    """Parse PDF_HUNTER_LLM_MAX_RETRIES once; None leaves the provider default."""
+    value = os.getenv("PDF_HUNTER_LLM_MAX_RETRIES", "").strip()
+    if not value:
+        return None
+    if not value.isdigit():
+        raise ValueError(f"PDF_HUNTER_LLM_MAX_RETRIES must be a non-negative integer, got {value!r}")
+    return int(value)
+
+
+def get_role_llm(role: str, **kwargs) -> BaseChatModel:
+    """Return the (cached) chat model configured for a role."""
+    max_retries = _llm_max_retries()
+    if max_retries is not None:
+        kwargs.setdefault("max_retries", max_retries)
+    return build_chat_model(
+        get_role_provider(role),
+        os.getenv(f"{role}_MODEL", DEFAULT_LLM_MODEL),
+        temperature=0,
+        **kwargs
+    )
+
+
+# Role accessors: call them (e.g. STATIC_ANALYSIS_TRIAGE_LLM()) to get the client
 # Static Analysis
-STATIC_ANALYSIS_ANALYST_LLM = openai_4o
-STATIC_ANALYSIS_TRIAGE_LLM = openai_4o
-STATIC_ANALYSIS_TECHNICIAN_LLM = openai_4o
-STATIC_ANALYSIS_STRATEGIC_REVIEW_LLM = openai_4o
+# Every static role sends the same forensic SYSTEM_PROMPT first, so a shared
+# prompt_cache_key lets OpenAI reuse the cached prefix across all four roles.
+# (An Anthropic model would need cache_control on the system message instead.)
+STATIC_ANALYSIS_PROMPT_CACHE_KEY = "pdf_hunter_static_v1"
+
+
+def get_static_analysis_llm(role: str) -> Runnable:
+    """Return the model for a static-analysis role, with prompt caching on OpenAI."""
+    llm = get_role_llm(role)
+    if get_role_provider(role) == "openai":
+        return llm.bind(prompt_cache_key=STATIC_ANALYSIS_PROMPT_CACHE_KEY)
+    return llm
+
+
+STATIC_ANALYSIS_ANALYST_LLM = partial(get_static_analysis_llm, "STATIC_ANALYSIS_ANALYST")
+STATIC_ANALYSIS_TRIAGE_LLM = partial(get_static_analysis_llm, "STATIC_ANALYSIS_TRIAGE")
+STATIC_ANALYSIS_TECHNICIAN_LLM = partial(get_static_analysis_llm, "STATIC_ANALYSIS_TECHNICIAN")
+STATIC_ANALYSIS_STRATEGIC_REVIEW_LLM = partial(get_static_analysis_llm, "STATIC_ANALYSIS_STRATEGIC_REVIEW")
 
 
 # Visual Analysis
-VISUAL_ANALYSIS_ANALYST_LLM = openai_4o
+def get_visual_analysis_llm() -> BaseChatModel:
+    """
+    Return the visual analyst model. On OpenAI it streams tokens so callers
+    using stream_mode="messages" see output as it arrives.
+    """
+    role = "VISUAL_ANALYSIS_ANALYST"
+    if get_role_provider(role) == "openai":
+        return get_role_llm(role, streaming=True)
+    return get_role_llm(role)
+
+
+VISUAL_ANALYSIS_ANALYST_LLM = get_visual_analysis_llm
 # VISUAL_ANALYSIS_ANALYST_LLM = huggingface_qwen_vl
 
 
@@ -8,13 +8,9 @@ This module contains the main composed graph that integrates:
 The composed graph uses subgraph integration following LangGraph patterns.
 """
 
-from .pdf_hunter_graph import (
-    app,
-    create_pdf_hunter_graph,
-    process_pdf_with_hunter,
-    PDFHunterInput,
-    PDFHunterOutput
-)
+import importlib
+
+from .schemas import PDFHunterInput, PDFHunterOutput
 
 __version__ = "0.1.0"
 
@@ -22,6 +18,27 @@ __all__ = [
     "app",
     "create_pdf_hunter_graph", 
     "process_pdf_with_hunter",
+    "aprocess_pdf_with_hunter",
+    "process_pdfs_with_hunter",
+    "aprocess_pdfs_with_hunter",
     "PDFHunterInput",
     "PDFHunterOutput"
-] 
\ No newline at end of file
+] 
+
+
+# The composed graph is imported on first access, so importing the schemas
+# (e.g. pdf_hunter_main.schemas) does not build the graph
+_LAZY_IMPORTS = {
+    "app": ".pdf_hunter_graph",
+    "create_pdf_hunter_graph": ".pdf_hunter_graph",
+    "process_pdf_with_hunter": ".pdf_hunter_graph",
+    "aprocess_pdf_with_hunter": ".pdf_hunter_graph",
+    "process_pdfs_with_hunter": ".pdf_hunter_graph",
+    "aprocess_pdfs_with_hunter": ".pdf_hunter_graph",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        return getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
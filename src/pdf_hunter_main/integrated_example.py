@@ -10,101 +10,209 @@ This demonstrates the enhanced PDF Hunter pipeline that now includes:
 The static and visual analysis now run in parallel for better performance.
 """
 
+import asyncio
+import logging
+import sys
+from functools import lru_cache
+
 from pdf_hunter_main.schemas import PDFHunterInput
-from pdf_hunter_main.pdf_hunter_graph import process_pdf_with_hunter
+from pdf_hunter_main.pdf_hunter_graph import aprocess_pdf_with_hunter
+
+SEP = "=" * 70
+
+PIPELINE_STEPS = "\n".join([
+    "\n🔄 Running Complete Analysis Pipeline...",
+    "   • PDF Processing (extract images, URLs, hashes)",
+    "   • Static Analysis (forensic investigation)",
+    "   • Visual Analysis (deception detection)",
+    "   • Final Aggregation (comprehensive results)",
+])
+
+ACCESS_PATTERNS = "\n".join([
+    "",
+    SEP,
+    "📖 VISUAL ANALYSIS ACCESS PATTERNS",
+    SEP,
+    "After running process_pdf_with_hunter(), you can access:",
+    "",
+    "# Get complete visual analysis results:",
+    "visual_result = result.visual_analysis_result",
+    "if visual_result:",
+    "    print(f'Verdict: {visual_result.overall_verdict}')",
+    "    print(f'Confidence: {visual_result.overall_confidence}')",
+    "    print(f'Summary: {visual_result.executive_summary}')",
+    "",
+    "# Access specific findings:",
+    "for tactic in visual_result.all_deception_tactics:",
+    "    print(f'Found: {tactic.tactic_type} - {tactic.description}')",
+    "",
+    "for url in visual_result.high_priority_urls:",
+    "    print(f'Investigate: {url.url} (Priority {url.priority})')",
+    "",
+    "# Get per-page analysis:",
+    "for page_analysis in visual_result.page_analyses:",
+    "    print(f'Page analysis: {page_analysis.visual_verdict}')",
+    "",
+    "# Access through summary:",
+    "summary = result.get_summary()",
+    "visual_summary = summary['visual_analysis']",
+    "print(f'Visual analysis available: {visual_summary[\"available\"]}')",
+])
+
+INTEGRATION_COMPLETE = "\n".join([
+    "",
+    SEP,
+    "🎉 INTEGRATION COMPLETE!",
+    SEP,
+    "The PDF Hunter now includes:",
+    "✅ PDF Processing (images, URLs, hashes)",
+    "✅ Static Analysis (forensic investigation)",
+    "✅ Visual Analysis (deception detection) - NEW!",
+    "✅ Parallel processing for better performance",
+    "✅ Complete results aggregation",
+    "✅ Future-ready for overview agent integration",
+    "",
+    "Next steps:",
+    "• Test with actual PDF files",
+    "• Use in LangGraph Studio: langgraph dev -> select 'pdf_hunter'",
+    "• Future: Add overview agent for final decision making",
+])
+
+
+@lru_cache(maxsize=256)
+def _title(key: str) -> str:
+    """Turn a summary key like 'visual_analysis' into 'Visual Analysis'."""
+    return key.replace('_', ' ').title()
+
+
+def _print_scalar(category: str, data) -> None:
+    print(f"   {_title(category)}: {data}")
+
+
+def _print_dict(category: str, data: dict) -> None:
+    print("\n".join(
+        [f"   {_title(category)}:"] +
+        [f"     - {_title(key)}: {value}" for key, value in data.items()]
+    ))
+
+
+# Summary value type -> printer; anything else is printed as a scalar
+_PRINTERS = {dict: _print_dict}
+
+
+@lru_cache(maxsize=None)
+def _make_input(pdf_path: str, pages: int, out_dir: str) -> PDFHunterInput:
+    """Build (and validate) the pipeline input once per argument tuple."""
+    return PDFHunterInput(
+        pdf_path=pdf_path,
+        pages_to_process=pages,
+        output_directory=out_dir
+    )
+
 
 def demonstrate_integrated_pipeline():
     """
     Demonstrate the complete integrated pipeline with visual analysis.
     """
-    print("🚀 PDF Hunter - Integrated Pipeline with Visual Analysis")
-    print("=" * 70)
+    print(f"🚀 PDF Hunter - Integrated Pipeline with Visual Analysis\n{SEP}")
     
     # Note: Update this path to point to an actual PDF file for testing
     test_pdf = "tests/sample.pdf"  # Update this path
     
     try:
         # Create input for the complete pipeline
-        input_data = PDFHunterInput(
-            pdf_path=test_pdf,
-            pages_to_process=1,  # Process first page
-            output_directory="./integrated_analysis_output"
+        input_data = _make_input(
+            test_pdf,
+            1,  # Process first page
+            "./integrated_analysis_output"
         )
         
-        print(f"📄 Analyzing: {input_data.pdf_path}")
-        print(f"📊 Pages to process: {input_data.pages_to_process}")
-        print(f"📁 Output directory: {input_data.output_directory}")
-        
-        print("\n🔄 Running Complete Analysis Pipeline...")
-        print("   • PDF Processing (extract images, URLs, hashes)")
-        print("   • Static Analysis (forensic investigation)")  
-        print("   • Visual Analysis (deception detection)")
-        print("   • Final Aggregation (comprehensive results)")
+        print("\n".join([
+            f"📄 Analyzing: {input_data.pdf_path}",
+            f"📊 Pages to process: {input_data.pages_to_process}",
+            f"📁 Output directory: {input_data.output_directory}",
+            PIPELINE_STEPS,
+        ]))
         
-        # Process with the complete hunter pipeline
-        result = process_pdf_with_hunter(input_data)
+        # Process with the complete hunter pipeline; static and visual analysis
+        # overlap on the event loop while visual analysis tokens are streamed
+        streamed_tokens = []
         
-        print(f"\n" + "=" * 70)
-        print(f"🏁 COMPLETE ANALYSIS RESULTS")
-        print(f"=" * 70)
+        def on_visual_token(token: str) -> None:
+            if not streamed_tokens:
+                print("\n👁️  Visual analyst: ", end="", flush=True)
+            streamed_tokens.append(token)
+            print(token, end="", flush=True)
         
-        # Overall Results
-        print(f"✅ Overall Success: {result.success}")
-        print(f"⏱️  Total Processing Time: {result.total_processing_time:.2f}s")
+        result = asyncio.run(aprocess_pdf_with_hunter(input_data, on_visual_token=on_visual_token))
+        if streamed_tokens:
+            print()
         
-        # PDF Processing Results
-        print(f"\n📊 PDF Processing Results:")
-        print(f"   • Page Count: {result.page_count}")
-        print(f"   • Images Extracted: {len(result.extracted_images)}")
-        print(f"   • URLs Found: {len(result.extracted_urls)}")
+        lines = [
+            "",
+            SEP,
+            "🏁 COMPLETE ANALYSIS RESULTS",
+            SEP,
+            # Overall Results
+            f"✅ Overall Success: {result.success}",
+            f"⏱️  Total Processing Time: {result.total_processing_time:.2f}s",
+            # PDF Processing Results
+            "\n📊 PDF Processing Results:",
+            f"   • Page Count: {result.page_count}",
+            f"   • Images Extracted: {len(result.extracted_images)}",
+            f"   • URLs Found: {len(result.extracted_urls)}",
+        ]
         if result.pdf_hash:
-            print(f"   • PDF SHA1: {result.pdf_hash.sha1[:16]}...")
-        print(f"   • Processing Errors: {len(result.pdf_processing_errors)}")
-        
-        # Static Analysis Results
-        print(f"\n🕵️  Static Analysis Results:")
-        print(f"   • Forensic Verdict: {result.forensic_verdict.value if result.forensic_verdict else 'N/A'}")
-        print(f"   • Coherence Score: {result.narrative_coherence_score}")
-        print(f"   • IoCs Found: {len(result.indicators_of_compromise)}")
-        print(f"   • Attack Chain Length: {result.attack_chain_length or 0}")
-        print(f"   • Artifacts Extracted: {result.extracted_artifacts_count or 0}")
-        print(f"   • Analysis Errors: {len(result.forensic_analysis_errors)}")
-        
-        # Visual Analysis Results - NEW!
-        print(f"\n👁️  Visual Analysis Results:")
-        if result.visual_analysis_result:
-            visual = result.visual_analysis_result
-            print(f"   • Visual Verdict: {visual.overall_verdict}")
-            print(f"   • Confidence Score: {visual.overall_confidence:.2f}")
-            print(f"   • Pages Analyzed: {visual.total_pages_analyzed}")
-            print(f"   • Deception Tactics Found: {len(visual.all_deception_tactics)}")
-            print(f"   • Benign Signals Found: {len(visual.all_benign_signals)}")
-            print(f"   • High Priority URLs: {len(visual.high_priority_urls)}")
-            print(f"   • Executive Summary: {visual.executive_summary}")
+            lines.append(f"   • PDF SHA1: {result.pdf_hash.sha1[:16]}...")
+        lines += [
+            f"   • Processing Errors: {len(result.pdf_processing_errors)}",
+            # Static Analysis Results
+            "\n🕵️  Static Analysis Results:",
+            f"   • Forensic Verdict: {result.forensic_verdict.value if result.forensic_verdict else 'N/A'}",
+            f"   • Coherence Score: {result.narrative_coherence_score}",
+            f"   • IoCs Found: {len(result.indicators_of_compromise)}",
+            f"   • Attack Chain Length: {result.attack_chain_length or 0}",
+            f"   • Artifacts Extracted: {result.extracted_artifacts_count or 0}",
+            f"   • Analysis Errors: {len(result.forensic_analysis_errors)}",
+            # Visual Analysis Results - NEW!
+            "\n👁️  Visual Analysis Results:",
+        ]
+        visual = result.visual_analysis_result
+        if visual:
+            lines += [
+                f"   • Visual Verdict: {visual.overall_verdict}",
+                f"   • Confidence Score: {visual.overall_confidence:.2f}",
+                f"   • Pages Analyzed: {visual.total_pages_analyzed}",
+                f"   • Deception Tactics Found: {len(visual.all_deception_tactics)}",
+                f"   • Benign Signals Found: {len(visual.all_benign_signals)}",
+                f"   • High Priority URLs: {len(visual.high_priority_urls)}",
+                f"   • Executive Summary: {visual.executive_summary}",
+            ]
         else:
-            print(f"   • Visual Analysis: Not available")
-        print(f"   • Analysis Errors: {len(result.visual_analysis_errors)}")
-        
-        # Combined Intelligence Assessment
-        print(f"\n🎯 Combined Intelligence Assessment:")
-        print(f"   • Is Suspicious (Forensic): {result.is_suspicious()}")
-        print(f"   • Has Forensic Artifacts: {result.has_artifacts()}")
-        if result.visual_analysis_result:
-            visual_suspicious = result.visual_analysis_result.overall_verdict in ["Suspicious", "Highly Deceptive"]
-            print(f"   • Is Suspicious (Visual): {visual_suspicious}")
+            lines.append("   • Visual Analysis: Not available")
+        lines += [
+            f"   • Analysis Errors: {len(result.visual_analysis_errors)}",
+            # Combined Intelligence Assessment
+            "\n🎯 Combined Intelligence Assessment:",
+            f"   • Is Suspicious (Forensic): {result.is_suspicious()}",
+            f"   • Has Forensic Artifacts: {result.has_artifacts()}",
+        ]
+        if visual:
+            visual_suspicious = visual.overall_verdict in ["Suspicious", "Highly Deceptive"]
+            lines.append(f"   • Is Suspicious (Visual): {visual_suspicious}")
         
         # Show detailed findings if available
-        if result.visual_analysis_result and result.visual_analysis_result.all_deception_tactics:
-            print(f"\n🚨 Top Deception Tactics Detected:")
-            for i, tactic in enumerate(result.visual_analysis_result.all_deception_tactics[:3], 1):
-                print(f"   {i}. {tactic.tactic_type} (confidence: {tactic.confidence:.2f})")
-                print(f"      {tactic.description}")
+        if visual and visual.all_deception_tactics:
+            lines.append("\n🚨 Top Deception Tactics Detected:")
+            for i, tactic in enumerate(visual.all_deception_tactics[:3], 1):
+                lines.append(f"   {i}. {tactic.tactic_type} (confidence: {tactic.confidence:.2f})")
+                lines.append(f"      {tactic.description}")
         
-        if result.visual_analysis_result and result.visual_analysis_result.high_priority_urls:
-            print(f"\n🔗 High Priority URLs for Investigation:")
-            for i, url in enumerate(result.visual_analysis_result.high_priority_urls[:3], 1):
-                print(f"   {i}. Priority {url.priority}: {url.url}")
-                print(f"      Reason: {url.reason}")
+        if visual and visual.high_priority_urls:
+            lines.append("\n🔗 High Priority URLs for Investigation:")
+            for i, url in enumerate(visual.high_priority_urls[:3], 1):
+                lines.append(f"   {i}. Priority {url.priority}: {url.url}")
+                lines.append(f"      Reason: {url.reason}")
         
         # Error Summary
         total_errors = (len(result.pdf_processing_errors) + 
@@ -112,23 +220,17 @@ def demonstrate_integrated_pipeline():
                        len(result.visual_analysis_errors))
         
         if total_errors > 0:
-            print(f"\n⚠️  Errors Encountered ({total_errors} total):")
-            for error in result.pdf_processing_errors:
-                print(f"   • PDF Processing: {error}")
-            for error in result.forensic_analysis_errors:
-                print(f"   • Static Analysis: {error}")
-            for error in result.visual_analysis_errors:
-                print(f"   • Visual Analysis: {error}")
+            lines.append(f"\n⚠️  Errors Encountered ({total_errors} total):")
+            lines += [f"   • PDF Processing: {error}" for error in result.pdf_processing_errors]
+            lines += [f"   • Static Analysis: {error}" for error in result.forensic_analysis_errors]
+            lines += [f"   • Visual Analysis: {error}" for error in result.visual_analysis_errors]
+        
+        print("\n".join(lines))
         
         print(f"\n📋 Complete Analysis Summary:")
         summary = result.get_summary()
         for category, data in summary.items():
-            if isinstance(data, dict):
-                print(f"   {category.replace('_', ' ').title()}:")
-                for key, value in data.items():
-                    print(f"     - {key.replace('_', ' ').title()}: {value}")
-            else:
-                print(f"   {category.replace('_', ' ').title()}: {data}")
+            _PRINTERS.get(type(data), _print_scalar)(category, data)
         
         return result
         
@@ -147,55 +249,17 @@ def demonstrate_access_patterns():
     """
     Demonstrate how to access the complete visual analysis results.
     """
-    print(f"\n" + "=" * 70)
-    print(f"📖 VISUAL ANALYSIS ACCESS PATTERNS")
-    print(f"=" * 70)
-    
-    print("After running process_pdf_with_hunter(), you can access:")
-    print()
-    print("# Get complete visual analysis results:")
-    print("visual_result = result.visual_analysis_result")
-    print("if visual_result:")
-    print("    print(f'Verdict: {visual_result.overall_verdict}')")
-    print("    print(f'Confidence: {visual_result.overall_confidence}')")
-    print("    print(f'Summary: {visual_result.executive_summary}')")
-    print()
-    print("# Access specific findings:")
-    print("for tactic in visual_result.all_deception_tactics:")
-    print("    print(f'Found: {tactic.tactic_type} - {tactic.description}')")
-    print()
-    print("for url in visual_result.high_priority_urls:")
-    print("    print(f'Investigate: {url.url} (Priority {url.priority})')")
-    print()
-    print("# Get per-page analysis:")
-    print("for page_analysis in visual_result.page_analyses:")
-    print("    print(f'Page analysis: {page_analysis.visual_verdict}')")
-    print()
-    print("# Access through summary:")
-    print("summary = result.get_summary()")
-    print("visual_summary = summary['visual_analysis']")
-    print("print(f'Visual analysis available: {visual_summary[\"available\"]}')")
+    print(ACCESS_PATTERNS)
 
 
 if __name__ == "__main__":
+    # Show the pipeline nodes' progress messages alongside the printed output
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+    
     # Run the demonstration
     result = demonstrate_integrated_pipeline()
     
     # Show access patterns
     demonstrate_access_patterns()
     
-    print(f"\n" + "=" * 70)
-    print(f"🎉 INTEGRATION COMPLETE!")
-    print(f"=" * 70)
-    print("The PDF Hunter now includes:")
-    print("✅ PDF Processing (images, URLs, hashes)")
-    print("✅ Static Analysis (forensic investigation)")
-    print("✅ Visual Analysis (deception detection) - NEW!")
-    print("✅ Parallel processing for better performance")
-    print("✅ Complete results aggregation")
-    print("✅ Future-ready for overview agent integration")
-    print()
-    print("Next steps:")
-    print("• Test with actual PDF files")
-    print("• Use in LangGraph Studio: langgraph dev -> select 'pdf_hunter'")
-    print("• Future: Add overview agent for final decision making")
\ No newline at end of file
+    print(INTEGRATION_COMPLETE)
@@ -7,36 +7,225 @@ and static analysis as subgraphs using the "different state schemas" pattern.
 Flow: PDF Processing -> Transform -> Static Analysis -> Final Aggregation
 """
 
+import asyncio
+import logging
+import math
+import os
+import sys
 import time
 from datetime import datetime
+from functools import lru_cache
 import pathlib
-from typing import Dict, Any
+from typing import Dict, Any, Callable, List, Optional, Union
 
+from langchain_core.runnables import RunnableLambda
 from langgraph.graph import StateGraph, START, END
+from langgraph.graph.state import CompiledStateGraph
+from pydantic import TypeAdapter
 
-# Import subgraph apps and schemas
-from pdf_processing.pdf_agent import app as pdf_processing_app
-from pdf_processing.agent_schemas import PDFProcessingInput
+# Import subgraph schemas (the compiled subgraph apps are loaded on first use below)
+from pdf_processing.agent_schemas import PDFProcessingInput, PDFHashData
+from pdf_processing.hashing import calculate_file_hashes
 
-from static_analysis.graph import app as static_analysis_app  
 from static_analysis.schemas import ForensicCaseFileInput, ForensicCaseFile, ForensicCaseFileOutput, Verdict, AnalysisPhase
 
-from visual_analysis.graph import app as visual_analysis_app
 from visual_analysis.schemas import VisualAnalysisInput, VisualAnalysisOutput
 
-# Import utility for file saving
-from pdf_processing.utils import ensure_output_directory
+from pdf_processing.agent_schemas import PDFProcessingOutput
 
 # Import our main schemas
 try:
     # Try relative imports first (when run as module)
-    from .schemas import PDFHunterInput, PDFHunterOutput, PDFHunterState
+    from .schemas import PDFHunterInput, PDFHunterOutput, PDFHunterState, ANALYSIS_MODE_STAGES
+    from .result_cache import cache_key, load_cached_result, save_cached_result
 except ImportError:
     # Fallback to absolute imports (when run directly)
-    import sys
-    import os
     sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-    from pdf_hunter_main.schemas import PDFHunterInput, PDFHunterOutput, PDFHunterState
+    from pdf_hunter_main.schemas import PDFHunterInput, PDFHunterOutput, PDFHunterState, ANALYSIS_MODE_STAGES
+    from pdf_hunter_main.result_cache import cache_key, load_cached_result, save_cached_result
+
+
+logger = logging.getLogger(__name__)
+
+# Subgraph results arrive either as Pydantic models or as plain dicts; these
+# adapters normalize both in a single pydantic-core call
+_PDF_ADAPTER = TypeAdapter(PDFProcessingOutput)
+# The static subgraph returns its full ForensicCaseFile state (or, already
+# converted, a ForensicCaseFileOutput)
+_FORENSIC_ADAPTER = TypeAdapter(Union[ForensicCaseFileOutput, ForensicCaseFile])
+_VISUAL_ADAPTER = TypeAdapter(VisualAnalysisOutput)
+
+
+# Subgraph Apps
+# Importing a subgraph builds its graph and pulls in its LLM, PyMuPDF and
+# analysis tool dependencies, so each app is imported when a node first runs
+# rather than when pdf_hunter_main is imported.
+@lru_cache(maxsize=None)
+def _pdf_processing_app():
+    """Return the compiled PDF processing subgraph, importing it on first use."""
+    from pdf_processing.pdf_agent import app
+    return app
+
+
+@lru_cache(maxsize=None)
+def _static_analysis_app():
+    """Return the compiled static analysis subgraph, importing it on first use."""
+    from static_analysis.graph import app
+    return app
+
+
+@lru_cache(maxsize=None)
+def _visual_analysis_app():
+    """Return the compiled visual analysis subgraph, importing it on first use."""
+    from visual_analysis.graph import app
+    return app
+
+
+# Upper bound (seconds) on each subgraph run in the async pipeline, so a hung
+# LLM call fails its branch instead of stalling the run (and its batch slot).
+# PDF_HUNTER_SUBGRAPH_TIMEOUT=0 disables it. Only the async nodes apply it; the
+# sync nodes run each subgraph to completion.
+DEFAULT_SUBGRAPH_TIMEOUT = 600.0
+
+
+def _subgraph_timeout() -> Optional[float]:
+    """Return the per-subgraph timeout from PDF_HUNTER_SUBGRAPH_TIMEOUT, or None if disabled."""
+    value = os.getenv("PDF_HUNTER_SUBGRAPH_TIMEOUT", "").strip()
+    if not value:
+        return DEFAULT_SUBGRAPH_TIMEOUT
+    try:
+        timeout = float(value)
+        if math.isnan(timeout):
+            raise ValueError(value)
+    except ValueError:
+        logger.warning(
+            "[!] PDF_HUNTER_SUBGRAPH_TIMEOUT must be a number of seconds, got %r; using the default of %gs",
+            value, DEFAULT_SUBGRAPH_TIMEOUT
+        )
+        return DEFAULT_SUBGRAPH_TIMEOUT
+    return timeout if timeout > 0 else None
+
+
+def _subgraph_timeout_error(subgraph_name: str, timeout: Optional[float]) -> TimeoutError:
+    return TimeoutError(f"{subgraph_name} did not finish within {timeout:g}s")
+
+
+async def _run_with_timeout(awaitable, subgraph_name: str):
+    """Await a subgraph run, failing with a descriptive TimeoutError once the timeout expires."""
+    timeout = _subgraph_timeout()
+    try:
+        return await asyncio.wait_for(awaitable, timeout)
+    except asyncio.TimeoutError:
+        raise _subgraph_timeout_error(subgraph_name, timeout) from None
+
+
+# Every digest the subgraphs need, calculated in one pass over the PDF
+PDF_HASH_ALGORITHMS = ("sha1", "md5", "sha256")
+
+
+def _precomputed_hash(state: PDFHunterState, algorithm: str) -> Optional[str]:
+    """Return a precomputed digest of the PDF, or None if it could not be hashed."""
+    return (state.get("precomputed_hashes") or {}).get(algorithm)
+
+
+def _result_cache_key(state: PDFHunterState, subgraph_name: str, *params) -> Optional[str]:
+    """Cache key for a subgraph run over the current PDF, or None if the PDF hash is unknown."""
+    pdf_sha256 = _precomputed_hash(state, "sha256")
+    return cache_key(subgraph_name, pdf_sha256, *params) if pdf_sha256 else None
+
+
+def _pdf_processing_cache_key(state: PDFHunterState) -> Optional[str]:
+    """
+    Cache key for the PDF processing subgraph. Its result carries the PDF path
+    and the paths of images saved in the output directory, so both are part of
+    the key and a shared cache never hands one run's paths to another.
+    """
+    output_directory = state.get("output_directory")
+    return _result_cache_key(
+        state,
+        "pdf_processing",
+        state.get("pages_to_process", 1),
+        pathlib.Path(state["pdf_path"]).resolve(),
+        pathlib.Path(output_directory).resolve() if output_directory and output_directory.strip() else None
+    )
+
+
+def _resolve_output_dir(output_directory: Optional[str]) -> str:
+    """Resolve the directory PDF Hunter reports are saved in, creating it if needed."""
+    if output_directory and output_directory.strip():
+        # Save in specified output directory
+        base_dir = pathlib.Path(output_directory).resolve()
+        base_dir.mkdir(parents=True, exist_ok=True)
+    else:
+        # Save in current directory (like other agents do)
+        base_dir = pathlib.Path(".").resolve()
+    return str(base_dir)
+
+
+def file_hashing_node(state: PDFHunterState) -> Dict[str, Any]:
+    """
+    Node that hashes the PDF contents once, before the analysis branches fan out.
+    
+    The subgraphs reuse the digests instead of re-reading the file, and the
+    SHA-256 keys their cached results. The report directory is resolved (and
+    created) here too, once per run.
+    """
+    try:
+        precomputed_hashes = calculate_file_hashes(state["pdf_path"], algorithms=PDF_HASH_ALGORITHMS)
+    except (OSError, ValueError):
+        precomputed_hashes = None  # Let the subgraphs report the unreadable file
+    try:
+        resolved_output_dir = _resolve_output_dir(state.get("output_directory"))
+    except OSError:
+        resolved_output_dir = None  # Let final aggregation report the unusable directory
+    return {"precomputed_hashes": precomputed_hashes, "resolved_output_dir": resolved_output_dir}
+
+
+def _pdf_processing_input(state: PDFHunterState) -> PDFProcessingInput:
+    """Transform the main state to PDF processing input."""
+    precomputed_hashes = state.get("precomputed_hashes")
+    return PDFProcessingInput(
+        pdf_path=state["pdf_path"],
+        pages_to_process=state.get("pages_to_process", 1),
+        output_directory=state.get("output_directory"),
+        pdf_hash=PDFHashData.from_hexdigest(
+            sha1=precomputed_hashes["sha1"],
+            md5=precomputed_hashes["md5"]
+        ) if precomputed_hashes else None
+    )
+
+
+def _pdf_processing_result(pdf_result_dict: Any) -> PDFProcessingOutput:
+    """Convert the PDF processing subgraph result into the output model kept in the state."""
+    pdf_result = _PDF_ADAPTER.validate_python(pdf_result_dict)
+    
+    # Keep saved images in the state as file references; the visual analysis
+    # subgraph reads the bytes back only when it sends a page to the LLM
+    return pdf_result.model_copy(update={
+        "extracted_images": [image.without_inline_data() for image in pdf_result.extracted_images]
+    })
+
+
+def _pdf_processing_update(pdf_result: PDFProcessingOutput) -> Dict[str, Any]:
+    """Log the PDF processing result and wrap it in a main state update."""
+    logger.info("✅ PDF Processing completed. Success: %s", pdf_result.success)
+    logger.info("   - Images extracted: %d", len(pdf_result.extracted_images))
+    logger.info("   - URLs found: %d", len(pdf_result.extracted_urls))
+    
+    # Transform result back to main state
+    return {
+        "pdf_processing_result": pdf_result
+    }
+
+
+def _pdf_processing_failure(e: Exception) -> Dict[str, Any]:
+    """State update for a failed PDF processing run."""
+    error_msg = f"PDF processing failed: {str(e)}"
+    logger.error("❌ %s", error_msg)
+    return {
+        "errors": [error_msg],
+        "pdf_processing_result": None
+    }
 
 
 def pdf_processing_node(state: PDFHunterState) -> Dict[str, Any]:
@@ -47,66 +236,102 @@ def pdf_processing_node(state: PDFHunterState) -> Dict[str, Any]:
     and transforms the result back to main state format.
     """
     try:
-        print("🔍 Starting PDF Processing subgraph...")
+        logger.info("🔍 Starting PDF Processing subgraph...")
         
-        # Transform main state to PDF processing input
-        pdf_input = PDFProcessingInput(
-            pdf_path=state["pdf_path"],
-            pages_to_process=state.get("pages_to_process", 1),
-            output_directory=state.get("output_directory")
-        )
+        key = _pdf_processing_cache_key(state)
+        pdf_result = load_cached_result(state.get("output_directory"), "pdf_processing", key, PDFProcessingOutput)
+        if pdf_result is None:
+            # Invoke the PDF processing subgraph
+            pdf_result = _pdf_processing_result(_pdf_processing_app().invoke(_pdf_processing_input(state)))
+            save_cached_result(state.get("output_directory"), "pdf_processing", key, pdf_result)
         
-        # Invoke the PDF processing subgraph
-        pdf_result_dict = pdf_processing_app.invoke(pdf_input.model_dump())
+        return _pdf_processing_update(pdf_result)
         
-        # Convert dict result to PDFProcessingOutput if needed
-        if isinstance(pdf_result_dict, dict):
-            from pdf_processing.agent_schemas import PDFProcessingOutput
-            pdf_result = PDFProcessingOutput(**pdf_result_dict)
-        else:
-            pdf_result = pdf_result_dict
+    except Exception as e:
+        return _pdf_processing_failure(e)
+
+
+async def apdf_processing_node(state: PDFHunterState) -> Dict[str, Any]:
+    """Async version of pdf_processing_node, awaiting the subgraph on the event loop."""
+    try:
+        logger.info("🔍 Starting PDF Processing subgraph...")
         
-        print(f"✅ PDF Processing completed. Success: {pdf_result.success}")
-        print(f"   - Images extracted: {len(pdf_result.extracted_images)}")
-        print(f"   - URLs found: {len(pdf_result.extracted_urls)}")
+        key = _pdf_processing_cache_key(state)
+        pdf_result = load_cached_result(state.get("output_directory"), "pdf_processing", key, PDFProcessingOutput)
+        if pdf_result is None:
+            pdf_result = _pdf_processing_result(await _run_with_timeout(
+                _pdf_processing_app().ainvoke(_pdf_processing_input(state)), "PDF processing"
+            ))
+            save_cached_result(state.get("output_directory"), "pdf_processing", key, pdf_result)
         
-        # Transform result back to main state
-        return {
-            "pdf_processing_result": pdf_result
-        }
+        return _pdf_processing_update(pdf_result)
         
     except Exception as e:
-        error_msg = f"PDF processing failed: {str(e)}"
-        print(f"❌ {error_msg}")
-        return {
-            "errors": [error_msg],
-            "pdf_processing_result": None
-        }
+        return _pdf_processing_failure(e)
 
 
-def static_analysis_node(state: PDFHunterState) -> Dict[str, Any]:
+# Allow enough steps for circuit breaker (MAX_INTERROGATION_STEPS=12)
+STATIC_ANALYSIS_CONFIG = {"recursion_limit": 20}
+
+
+def _with_stop_error(last_state: Dict[str, Any], e: Exception) -> Dict[str, Any]:
+    """Record why the static analysis stream stopped on the last state it produced."""
+    return {**last_state, "errors": [*last_state.get("errors", []), f"Static analysis stopped early: {str(e)}"]}
+
+
+def _stream_static_analysis(forensic_input: ForensicCaseFileInput) -> Dict[str, Any]:
     """
-    Node that invokes the static analysis subgraph.
-    
-    Transforms the main state to forensic analysis input, invokes the subgraph,
-    and transforms the result back to main state format.
+    Run the static analysis subgraph, keeping the state after every step so a
+    failure part-way through (e.g. hitting the recursion limit) still yields
+    the evidence gathered so far instead of discarding it.
     """
+    last_state = None
     try:
-        print("🕵️ Starting Static Analysis subgraph...")
-        
-        # Transform main state to static analysis input (only needs file_path)
-        forensic_input = ForensicCaseFileInput(
-            file_path=state["pdf_path"]
-        )
-        
-        # Invoke the static analysis subgraph with higher recursion limit to allow circuit breaker to work
-        forensic_result_dict = static_analysis_app.invoke(
-            forensic_input.model_dump(), 
-            {"recursion_limit": 20}  # Allow enough steps for circuit breaker (MAX_INTERROGATION_STEPS=12)
-        )
-        
-        # Debug: Print what we actually received
-        print(f"🔍 Debug: Static analysis returned type: {type(forensic_result_dict)}")
+        step = 0
+        for state in _static_analysis_app().stream(forensic_input, STATIC_ANALYSIS_CONFIG, stream_mode="values"):
+            # The first state is only the input; keep states produced by the nodes
+            if step:
+                last_state = state
+            step += 1
+    except Exception as e:
+        if last_state is None:
+            raise
+        return _with_stop_error(last_state, e)
+    return last_state
+
+
+async def _astream_static_analysis(forensic_input: ForensicCaseFileInput) -> Dict[str, Any]:
+    """
+    Async version of _stream_static_analysis. A run that exceeds the subgraph
+    timeout also keeps the evidence gathered before it was cut off.
+    """
+    last_state = None
+    timeout = _subgraph_timeout()
+    try:
+        step = 0
+        async with asyncio.timeout(timeout):
+            async for state in _static_analysis_app().astream(forensic_input, STATIC_ANALYSIS_CONFIG, stream_mode="values"):
+                # The first state is only the input; keep states produced by the nodes
+                if step:
+                    last_state = state
+                step += 1
+    except TimeoutError:
+        e = _subgraph_timeout_error("Static analysis", timeout)
+        if last_state is None:
+            raise e from None
+        return _with_stop_error(last_state, e)
+    except Exception as e:
+        if last_state is None:
+            raise
+        return _with_stop_error(last_state, e)
+    return last_state
+
+
+def _static_analysis_update(forensic_result_dict: Any, forensic_input: ForensicCaseFileInput) -> Dict[str, Any]:
+    """Convert the static analysis subgraph result into a main state update."""
+    # Debug: Log what we actually received (skipped entirely unless DEBUG is enabled)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Static analysis returned type: %s", type(forensic_result_dict))
         if isinstance(forensic_result_dict, dict):
             evidence = forensic_result_dict.get('evidence', {})
             # Handle both dict and EvidenceLocker object
@@ -118,90 +343,212 @@ def static_analysis_node(state: PDFHunterState) -> Dict[str, Any]:
                 # Dictionary
                 iocs = evidence.get('indicators_of_compromise', [])
                 attack_chain = evidence.get('attack_chain', [])
-            print(f"🔍 Debug: IoCs in dict evidence: {len(iocs)}")
-            print(f"🔍 Debug: Attack chain in dict evidence: {len(attack_chain)}")
+            logger.debug("IoCs in dict evidence: %d", len(iocs))
+            logger.debug("Attack chain in dict evidence: %d", len(attack_chain))
             # Additional debug to see the actual IoC data
             if iocs:
-                print(f"🔍 Debug: First IoC: {iocs[0]}")
+                logger.debug("First IoC: %s", iocs[0])
         elif hasattr(forensic_result_dict, 'indicators_of_compromise'):
-            print(f"🔍 Debug: IoCs in result: {len(forensic_result_dict.indicators_of_compromise)}")
+            logger.debug("IoCs in result: %d", len(forensic_result_dict.indicators_of_compromise))
         if hasattr(forensic_result_dict, 'attack_chain_length'):
-            print(f"🔍 Debug: Attack chain length: {forensic_result_dict.attack_chain_length}")
+            logger.debug("Attack chain length: %s", forensic_result_dict.attack_chain_length)
+    
+    try:
+        forensic_result = _FORENSIC_ADAPTER.validate_python(forensic_result_dict)
+    except Exception as e:
+        # If conversion fails, create a minimal output with error info
+        forensic_result = ForensicCaseFileOutput(
+            success=False,
+            file_path=forensic_input.file_path,
+            analysis_session_id="conversion_failed",
+            verdict=Verdict.PRESUMED_INNOCENT,
+            phase=AnalysisPhase.TRIAGE, 
+            narrative_coherence_score=0.5,
+            total_interrogation_steps=0,
+            errors=[f"Failed to convert static analysis result: {str(e)}"]
+        )
+    
+    if isinstance(forensic_result, ForensicCaseFile):
+        case_file = forensic_result
+        logger.debug("case_file IoCs: %d", len(case_file.evidence.indicators_of_compromise))
         
-        # Handle the result based on what LangGraph returns
-        if isinstance(forensic_result_dict, dict):
-            # The static analysis returns a ForensicCaseFile dict, we need to convert it to ForensicCaseFileOutput
-            try:
-                # First convert to ForensicCaseFile to get the full state
-                case_file = ForensicCaseFile(**forensic_result_dict)
-                
-                # Debug the case_file IoCs
-                print(f"🔍 Debug: case_file IoCs: {len(case_file.evidence.indicators_of_compromise)}")
-                
-                # Then convert to the output schema using the conversion function
-                forensic_result = ForensicCaseFileOutput(
-                    success=len(case_file.errors) == 0,
-                    file_path=case_file.file_path,
-                    file_hash_sha256=case_file.file_hash_sha256,
-                    analysis_session_id=case_file.analysis_session_id,
-                    verdict=case_file.verdict,
-                    phase=case_file.phase,
-                    current_hypothesis=case_file.current_hypothesis,
-                    narrative_coherence_score=case_file.narrative_coherence.score,
-                    total_interrogation_steps=case_file.interrogation_steps,
-                    indicators_of_compromise=case_file.evidence.indicators_of_compromise,
-                    attack_chain_length=len(case_file.evidence.attack_chain),
-                    extracted_artifacts_count=len(case_file.evidence.extracted_artifacts),
-                    final_report=case_file.final_report,
-                    errors=case_file.errors
-                )
-                print(f"🔍 Debug: Converted dict to ForensicCaseFileOutput with {len(forensic_result.indicators_of_compromise)} IoCs and attack chain length {forensic_result.attack_chain_length}")
-            except Exception as e:
-                # If conversion fails, create a minimal output with error info
-                forensic_result = ForensicCaseFileOutput(
-                    success=False,
-                    file_path=forensic_input.file_path,
-                    analysis_session_id="conversion_failed",
-                    verdict=Verdict.PRESUMED_INNOCENT,
-                    phase=AnalysisPhase.TRIAGE, 
-                    narrative_coherence_score=0.5,
-                    total_interrogation_steps=0,
-                    errors=[f"Failed to convert static analysis result: {str(e)}"]
-                )
-        elif isinstance(forensic_result_dict, ForensicCaseFileOutput):
-            # LangGraph already converted it to ForensicCaseFileOutput due to output_schema
-            forensic_result = forensic_result_dict
-            print(f"🔍 Debug: Using direct ForensicCaseFileOutput object")
-        else:
-            # Fallback case - create a minimal output with error
-            forensic_result = ForensicCaseFileOutput(
-                success=False,
-                file_path=forensic_input.file_path,
-                analysis_session_id="unexpected_type",
-                verdict=Verdict.PRESUMED_INNOCENT,
-                phase=AnalysisPhase.TRIAGE,
-                narrative_coherence_score=0.5,
-                total_interrogation_steps=0,
-                errors=[f"Unexpected result type from static analysis: {type(forensic_result_dict)}"]
-            )
-        
-        print(f"✅ Static Analysis completed. Success: {forensic_result.success}")
-        print(f"   - Verdict: {forensic_result.verdict.value}")
-        print(f"   - IoCs found: {len(forensic_result.indicators_of_compromise)}")
-        print(f"   - Attack chain length: {forensic_result.attack_chain_length}")
-        
-        # Transform result back to main state
-        return {
-            "static_analysis_result": forensic_result
-        }
+        # Convert to the output schema; every field comes from the validated
+        # case file, so skip re-validating the IoCs with model_construct
+        forensic_result = ForensicCaseFileOutput.model_construct(
+            success=len(case_file.errors) == 0,
+            file_path=case_file.file_path,
+            file_hash_sha256=case_file.file_hash_sha256,
+            analysis_session_id=case_file.analysis_session_id,
+            verdict=case_file.verdict,
+            phase=case_file.phase,
+            current_hypothesis=case_file.current_hypothesis,
+            narrative_coherence_score=case_file.narrative_coherence.score,
+            total_interrogation_steps=case_file.interrogation_steps,
+            indicators_of_compromise=case_file.evidence.indicators_of_compromise,
+            attack_chain_length=len(case_file.evidence.attack_chain),
+            extracted_artifacts_count=len(case_file.evidence.extracted_artifacts),
+            final_report=case_file.final_report,
+            errors=case_file.errors
+        )
+        logger.debug(
+            "Converted case file to ForensicCaseFileOutput with %d IoCs and attack chain length %s",
+            len(forensic_result.indicators_of_compromise), forensic_result.attack_chain_length
+        )
+    
+    logger.info("✅ Static Analysis completed. Success: %s", forensic_result.success)
+    logger.info("   - Verdict: %s", forensic_result.verdict.value)
+    logger.info("   - IoCs found: %d", len(forensic_result.indicators_of_compromise))
+    logger.info("   - Attack chain length: %s", forensic_result.attack_chain_length)
+    
+    # Transform result back to main state
+    return {
+        "static_analysis_result": forensic_result
+    }
+
+
+def _static_analysis_failure(e: Exception) -> Dict[str, Any]:
+    """State update for a failed static analysis run."""
+    error_msg = f"Static analysis failed: {str(e)}"
+    logger.error("❌ %s", error_msg)
+    return {
+        "errors": [error_msg],
+        "static_analysis_result": None
+    }
+
+
+def static_analysis_node(state: PDFHunterState) -> Dict[str, Any]:
+    """
+    Node that invokes the static analysis subgraph.
+    
+    Transforms the main state to forensic analysis input, invokes the subgraph,
+    and transforms the result back to main state format.
+    """
+    try:
+        logger.info("🕵️ Starting Static Analysis subgraph...")
+        
+        key = _result_cache_key(state, "static_analysis")
+        cached = load_cached_result(state.get("output_directory"), "static_analysis", key, ForensicCaseFileOutput)
+        if cached is not None:
+            return {"static_analysis_result": cached}
+        
+        # Transform main state to static analysis input (file_path plus the shared SHA-256)
+        forensic_input = ForensicCaseFileInput(
+            file_path=state["pdf_path"],
+            file_hash_sha256=_precomputed_hash(state, "sha256")
+        )
+        
+        # Stream the static analysis subgraph with higher recursion limit to allow circuit breaker to work
+        forensic_result_dict = _stream_static_analysis(forensic_input)
+        
+        update = _static_analysis_update(forensic_result_dict, forensic_input)
+        save_cached_result(state.get("output_directory"), "static_analysis", key, update["static_analysis_result"])
+        return update
         
     except Exception as e:
-        error_msg = f"Static analysis failed: {str(e)}"
-        print(f"❌ {error_msg}")
+        return _static_analysis_failure(e)
+
+
+async def astatic_analysis_node(state: PDFHunterState) -> Dict[str, Any]:
+    """Async version of static_analysis_node, awaiting the subgraph on the event loop."""
+    try:
+        logger.info("🕵️ Starting Static Analysis subgraph...")
+        
+        key = _result_cache_key(state, "static_analysis")
+        cached = load_cached_result(state.get("output_directory"), "static_analysis", key, ForensicCaseFileOutput)
+        if cached is not None:
+            return {"static_analysis_result": cached}
+        
+        forensic_input = ForensicCaseFileInput(
+            file_path=state["pdf_path"],
+            file_hash_sha256=_precomputed_hash(state, "sha256")
+        )
+        
+        forensic_result_dict = await _astream_static_analysis(forensic_input)
+        
+        update = _static_analysis_update(forensic_result_dict, forensic_input)
+        save_cached_result(state.get("output_directory"), "static_analysis", key, update["static_analysis_result"])
+        return update
+        
+    except Exception as e:
+        return _static_analysis_failure(e)
+
+
+def _prepare_visual_analysis(state: PDFHunterState) -> Union[VisualAnalysisInput, Dict[str, Any]]:
+    """
+    Build the visual analysis input from the PDF processing results, or return
+    the state update to use when visual analysis has to be skipped.
+    """
+    # Get PDF processing results to extract images and URLs
+    pdf_result = state.get("pdf_processing_result")
+    
+    if not pdf_result or not pdf_result.success:
+        logger.warning("⚠️  Visual analysis skipped: PDF processing failed or unavailable")
         return {
-            "errors": [error_msg],
-            "static_analysis_result": None
+            "errors": ["Visual analysis skipped: PDF processing failed"],
+            "visual_analysis_result": None
+        }
+    
+    # Check if we have images to analyze
+    if not pdf_result.extracted_images:
+        logger.warning("⚠️  Visual analysis skipped: No images extracted from PDF")
+        return {
+            "errors": ["Visual analysis skipped: No images available"],
+            "visual_analysis_result": None
         }
+    
+    # Transform to visual analysis input using extracted data
+    visual_input = VisualAnalysisInput(
+        extracted_images=pdf_result.extracted_images,
+        extracted_urls=pdf_result.extracted_urls,
+        output_directory=state.get("output_directory")
+    )
+    
+    logger.info("   - Images to analyze: %d", len(pdf_result.extracted_images))
+    logger.info("   - URLs for cross-modal analysis: %d", len(pdf_result.extracted_urls))
+    
+    return visual_input
+
+
+def _visual_analysis_update(visual_result_dict: Any) -> Dict[str, Any]:
+    """Convert the visual analysis subgraph result into a main state update."""
+    # LangGraph converts Pydantic objects to dictionaries between subgraphs; the
+    # result is normally nested under final_output (from aggregation_node)
+    if isinstance(visual_result_dict, dict):
+        visual_result_dict = visual_result_dict.get("final_output", visual_result_dict)
+    try:
+        visual_result = _VISUAL_ADAPTER.validate_python(visual_result_dict)
+    except Exception as e:
+        logger.warning("⚠️  Failed to convert visual analysis result: %s", e)
+        visual_result = VisualAnalysisOutput(
+            success=False,
+            total_pages_analyzed=0,
+            overall_verdict="Suspicious",
+            overall_confidence=0.0,
+            executive_summary=f"Conversion failed: {str(e)}",
+            errors=[f"Result conversion failed: {str(e)}"]
+        )
+    
+    logger.info("✅ Visual Analysis completed. Success: %s", visual_result.success)
+    logger.info("   - Verdict: %s", visual_result.overall_verdict)
+    logger.info("   - Confidence: %.2f", visual_result.overall_confidence)
+    logger.info("   - Pages analyzed: %d", visual_result.total_pages_analyzed)
+    logger.info("   - Deception tactics: %d", len(visual_result.all_deception_tactics))
+    logger.info("   - High priority URLs: %d", len(visual_result.high_priority_urls))
+    
+    # Transform result back to main state
+    return {
+        "visual_analysis_result": visual_result
+    }
+
+
+def _visual_analysis_failure(e: Exception) -> Dict[str, Any]:
+    """State update for a failed visual analysis run."""
+    error_msg = f"Visual analysis failed: {str(e)}"
+    logger.error("❌ %s", error_msg)
+    return {
+        "errors": [error_msg],
+        "visual_analysis_result": None
+    }
 
 
 def visual_analysis_node(state: PDFHunterState) -> Dict[str, Any]:
@@ -212,119 +559,50 @@ def visual_analysis_node(state: PDFHunterState) -> Dict[str, Any]:
     visual deception analysis.
     """
     try:
-        print("👁️  Starting Visual Analysis subgraph...")
-        
-        # Get PDF processing results to extract images and URLs
-        pdf_result = state.get("pdf_processing_result")
-        
-        if not pdf_result or not pdf_result.success:
-            print("⚠️  Visual analysis skipped: PDF processing failed or unavailable")
-            return {
-                "errors": ["Visual analysis skipped: PDF processing failed"],
-                "visual_analysis_result": None
-            }
-        
-        # Check if we have images to analyze
-        if not pdf_result.extracted_images:
-            print("⚠️  Visual analysis skipped: No images extracted from PDF")
-            return {
-                "errors": ["Visual analysis skipped: No images available"],
-                "visual_analysis_result": None
-            }
-        
-        # Transform to visual analysis input using extracted data
-        visual_input = VisualAnalysisInput(
-            extracted_images=pdf_result.extracted_images,
-            extracted_urls=pdf_result.extracted_urls,
-            output_directory=state.get("output_directory")
-        )
+        logger.info("👁️  Starting Visual Analysis subgraph...")
+        
+        visual_input = _prepare_visual_analysis(state)
+        if isinstance(visual_input, dict):
+            return visual_input
         
-        print(f"   - Images to analyze: {len(pdf_result.extracted_images)}")
-        print(f"   - URLs for cross-modal analysis: {len(pdf_result.extracted_urls)}")
+        key = _result_cache_key(state, "visual_analysis", state.get("pages_to_process", 1))
+        cached = load_cached_result(state.get("output_directory"), "visual_analysis", key, VisualAnalysisOutput)
+        if cached is not None:
+            return {"visual_analysis_result": cached}
         
         # Invoke the visual analysis subgraph
-        visual_result_dict = visual_analysis_app.invoke(visual_input.model_dump())
-        
-        # Handle the result - LangGraph converts Pydantic objects to dictionaries between subgraphs
-        if isinstance(visual_result_dict, dict):
-            # Check if it has final_output (from aggregation_node)
-            if "final_output" in visual_result_dict:
-                final_output_data = visual_result_dict["final_output"]
-                # The final_output might be a VisualAnalysisOutput object or a dictionary
-                if isinstance(final_output_data, VisualAnalysisOutput):
-                    visual_result = final_output_data
-                elif isinstance(final_output_data, dict):
-                    # Convert the dictionary back to VisualAnalysisOutput
-                    try:
-                        visual_result = VisualAnalysisOutput(**final_output_data)
-                        print(f"✅ Successfully converted visual analysis dictionary to VisualAnalysisOutput")
-                    except Exception as e:
-                        print(f"⚠️  Failed to convert final_output dictionary: {str(e)}")
-                        visual_result = VisualAnalysisOutput(
-                            success=False,
-                            total_pages_analyzed=0,
-                            overall_verdict="Suspicious",
-                            overall_confidence=0.0,
-                            executive_summary=f"final_output conversion failed: {str(e)}",
-                            errors=[f"final_output conversion failed: {str(e)}"]
-                        )
-                else:
-                    print(f"⚠️  Unexpected final_output type: {type(final_output_data)}")
-                    visual_result = VisualAnalysisOutput(
-                        success=False,
-                        total_pages_analyzed=0,
-                        overall_verdict="Suspicious",
-                        overall_confidence=0.0,
-                        executive_summary=f"Unexpected final_output type: {type(final_output_data)}",
-                        errors=[f"Unexpected final_output type: {type(final_output_data)}"]
-                    )
-            else:
-                # Try to convert the entire dict to VisualAnalysisOutput (fallback)
-                try:
-                    visual_result = VisualAnalysisOutput(**visual_result_dict)
-                    print(f"✅ Successfully converted entire visual analysis dictionary to VisualAnalysisOutput")
-                except Exception as e:
-                    print(f"⚠️  Failed to convert visual analysis result: {str(e)}")
-                    visual_result = VisualAnalysisOutput(
-                        success=False,
-                        total_pages_analyzed=0,
-                        overall_verdict="Suspicious",
-                        overall_confidence=0.0,
-                        executive_summary=f"Conversion failed: {str(e)}",
-                        errors=[f"Result conversion failed: {str(e)}"]
-                    )
-        elif isinstance(visual_result_dict, VisualAnalysisOutput):
-            visual_result = visual_result_dict
-        else:
-            # Fallback case
-            visual_result = VisualAnalysisOutput(
-                success=False,
-                total_pages_analyzed=0,
-                overall_verdict="Suspicious", 
-                overall_confidence=0.0,
-                executive_summary="Unexpected result format from visual analysis",
-                errors=[f"Unexpected result type: {type(visual_result_dict)}"]
-            )
-        
-        print(f"✅ Visual Analysis completed. Success: {visual_result.success}")
-        print(f"   - Verdict: {visual_result.overall_verdict}")
-        print(f"   - Confidence: {visual_result.overall_confidence:.2f}")
-        print(f"   - Pages analyzed: {visual_result.total_pages_analyzed}")
-        print(f"   - Deception tactics: {len(visual_result.all_deception_tactics)}")
-        print(f"   - High priority URLs: {len(visual_result.high_priority_urls)}")
-        
-        # Transform result back to main state
-        return {
-            "visual_analysis_result": visual_result
-        }
+        visual_result_dict = _visual_analysis_app().invoke(visual_input)
+        
+        update = _visual_analysis_update(visual_result_dict)
+        save_cached_result(state.get("output_directory"), "visual_analysis", key, update["visual_analysis_result"])
+        return update
         
     except Exception as e:
-        error_msg = f"Visual analysis failed: {str(e)}"
-        print(f"❌ {error_msg}")
-        return {
-            "errors": [error_msg],
-            "visual_analysis_result": None
-        }
+        return _visual_analysis_failure(e)
+
+
+async def avisual_analysis_node(state: PDFHunterState) -> Dict[str, Any]:
+    """Async version of visual_analysis_node, awaiting the subgraph on the event loop."""
+    try:
+        logger.info("👁️  Starting Visual Analysis subgraph...")
+        
+        visual_input = _prepare_visual_analysis(state)
+        if isinstance(visual_input, dict):
+            return visual_input
+        
+        key = _result_cache_key(state, "visual_analysis", state.get("pages_to_process", 1))
+        cached = load_cached_result(state.get("output_directory"), "visual_analysis", key, VisualAnalysisOutput)
+        if cached is not None:
+            return {"visual_analysis_result": cached}
+        
+        visual_result_dict = await _run_with_timeout(_visual_analysis_app().ainvoke(visual_input), "Visual analysis")
+        
+        update = _visual_analysis_update(visual_result_dict)
+        save_cached_result(state.get("output_directory"), "visual_analysis", key, update["visual_analysis_result"])
+        return update
+        
+    except Exception as e:
+        return _visual_analysis_failure(e)
 
 
 def final_aggregation_node(state: PDFHunterState) -> PDFHunterOutput:
@@ -332,145 +610,126 @@ def final_aggregation_node(state: PDFHunterState) -> PDFHunterOutput:
     Final aggregation node that combines results from all three subgraphs 
     into the final output schema.
     """
+    # Every subgraph node stores a validated Pydantic model (or None) in the state
+    pdf_result = state.get("pdf_processing_result")
+    forensic_result = state.get("static_analysis_result")
+    visual_result = state.get("visual_analysis_result")
+    
     try:
-        print("📊 Performing final aggregation...")
+        logger.info("📊 Performing final aggregation...")
         
-        # Get results from all subgraphs
-        pdf_result = state.get("pdf_processing_result")
-        forensic_result = state.get("static_analysis_result")
-        visual_result = state.get("visual_analysis_result")
         main_errors = state.get("errors", [])
         
-        # Determine overall success - handle both dict and object types
-        if isinstance(pdf_result, dict):
-            pdf_success = pdf_result.get("success", False)
-        else:
-            pdf_success = pdf_result.success if pdf_result else False
-            
-        if isinstance(forensic_result, dict):
-            forensic_success = forensic_result.get("success", False)
-        else:
-            forensic_success = forensic_result.success if forensic_result else False
-            
-        if isinstance(visual_result, dict):
-            visual_success = visual_result.get("success", False)
-        else:
-            visual_success = visual_result.success if visual_result else False
+        # Determine overall success over the stages this run's mode includes
+        stages = ANALYSIS_MODE_STAGES[state.get("mode") or "full"]
+        pdf_success = pdf_result.success if pdf_result else "pdf_processing" not in stages
+        forensic_success = forensic_result.success if forensic_result else "static_analysis" not in stages
+        visual_success = visual_result.success if visual_result else "visual_analysis" not in stages
             
         overall_success = pdf_success and forensic_success and visual_success and len(main_errors) == 0
         
-        # Helper function to safely get attributes from dict or object
-        def safe_get(obj, attr, default=None):
-            if obj is None:
-                return default
-            if isinstance(obj, dict):
-                return obj.get(attr, default)
-            else:
-                return getattr(obj, attr, default)
-        
-        # Helper function to safely get IoCs, ensuring they are properly serializable
-        def safe_get_iocs(obj, default=None):
-            if default is None:
-                default = []
-            iocs = safe_get(obj, "indicators_of_compromise", default)
-            # If we got Pydantic objects, convert them to dicts and back to ensure compatibility
-            if iocs and hasattr(iocs[0], 'model_dump'):
-                from static_analysis.schemas import IndicatorOfCompromise
-                return [IndicatorOfCompromise(**ioc.model_dump()) if hasattr(ioc, 'model_dump') else ioc for ioc in iocs]
-            return iocs
-        
-        # Create comprehensive output
-        output = PDFHunterOutput(
+        # Create comprehensive output; every value comes from the validated
+        # subgraph results, so skip re-validating the images, URLs and IoCs
+        output = PDFHunterOutput.model_construct(
             success=overall_success,
             pdf_path=state["pdf_path"],
             
             # PDF Processing Results
-            pdf_hash=safe_get(pdf_result, "pdf_hash"),
-            page_count=safe_get(pdf_result, "page_count"),
-            extracted_images=safe_get(pdf_result, "extracted_images", []),
-            extracted_urls=safe_get(pdf_result, "extracted_urls", []),
+            pdf_hash=pdf_result.pdf_hash if pdf_result else None,
+            page_count=pdf_result.page_count if pdf_result else None,
+            extracted_images=pdf_result.extracted_images if pdf_result else [],
+            extracted_urls=pdf_result.extracted_urls if pdf_result else [],
             
             # Static Analysis Results
-            forensic_verdict=safe_get(forensic_result, "verdict"),
-            analysis_phase=safe_get(forensic_result, "phase"),
-            forensic_hypothesis=safe_get(forensic_result, "current_hypothesis"),
-            narrative_coherence_score=safe_get(forensic_result, "narrative_coherence_score"),
-            indicators_of_compromise=safe_get_iocs(forensic_result, []),
-            attack_chain_length=safe_get(forensic_result, "attack_chain_length"),
-            extracted_artifacts_count=safe_get(forensic_result, "extracted_artifacts_count"),
-            forensic_session_id=safe_get(forensic_result, "analysis_session_id"),
+            forensic_verdict=forensic_result.verdict if forensic_result else None,
+            analysis_phase=forensic_result.phase if forensic_result else None,
+            forensic_hypothesis=forensic_result.current_hypothesis if forensic_result else None,
+            narrative_coherence_score=forensic_result.narrative_coherence_score if forensic_result else None,
+            indicators_of_compromise=forensic_result.indicators_of_compromise if forensic_result else [],
+            attack_chain_length=forensic_result.attack_chain_length if forensic_result else None,
+            extracted_artifacts_count=forensic_result.extracted_artifacts_count if forensic_result else None,
+            forensic_session_id=forensic_result.analysis_session_id if forensic_result else None,
             
             # Visual Analysis Results
-            visual_verdict=safe_get(visual_result, "overall_verdict"),
-            visual_confidence=safe_get(visual_result, "overall_confidence"),
-            visual_pages_analyzed=safe_get(visual_result, "total_pages_analyzed"),
-            visual_executive_summary=safe_get(visual_result, "executive_summary"),
-            visual_deception_tactics_count=len(safe_get(visual_result, "all_deception_tactics", [])),
-            visual_benign_signals_count=len(safe_get(visual_result, "all_benign_signals", [])),
-            visual_high_priority_urls_count=len(safe_get(visual_result, "high_priority_urls", [])),
+            visual_verdict=visual_result.overall_verdict if visual_result else None,
+            visual_confidence=visual_result.overall_confidence if visual_result else None,
+            visual_pages_analyzed=visual_result.total_pages_analyzed if visual_result else None,
+            visual_executive_summary=visual_result.executive_summary if visual_result else None,
+            visual_deception_tactics_count=len(visual_result.all_deception_tactics) if visual_result else 0,
+            visual_benign_signals_count=len(visual_result.all_benign_signals) if visual_result else 0,
+            visual_high_priority_urls_count=len(visual_result.high_priority_urls) if visual_result else 0,
+            visual_analysis_result=visual_result,
             
             # Error aggregation
-            pdf_processing_errors=safe_get(pdf_result, "errors", []),
-            forensic_analysis_errors=safe_get(forensic_result, "errors", []),
-            visual_analysis_errors=safe_get(visual_result, "errors", []),
+            pdf_processing_errors=pdf_result.errors if pdf_result else [],
+            forensic_analysis_errors=forensic_result.errors if forensic_result else [],
+            visual_analysis_errors=visual_result.errors if visual_result else [],
             
             # Timing will be set by the main processing function
             total_processing_time=None
         )
         
-        # Store the visual analysis result for access via property
-        if visual_result:
-            output._visual_analysis_result = visual_result
-        
-        print(f"✅ Final aggregation completed. Overall success: {overall_success}")
+        logger.info("✅ Final aggregation completed. Overall success: %s", overall_success)
         
         # Save the comprehensive results to a JSON file
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         output_filename = f"pdf_hunter_report_{timestamp}.json"
         
-        # Handle output directory
-        output_directory = state.get("output_directory")
-        if output_directory and output_directory.strip():
-            # Save in specified output directory
-            output_path = pathlib.Path(output_directory) / output_filename
-            ensure_output_directory(output_path)
-            print(f"[*] Saving PDF Hunter report to {output_path}...")
-        else:
-            # Save in current directory (like other agents do)
-            output_path = pathlib.Path(output_filename)
-            print(f"[*] Saving PDF Hunter report to {output_path}...")
+        # Reports go to the directory file_hashing_node resolved (and created)
+        # when the run started; if that failed, resolving again reports why
+        output_directory = state.get("resolved_output_dir") or _resolve_output_dir(state.get("output_directory"))
+        output_path = pathlib.Path(output_directory) / output_filename
+        logger.info("[*] Saving PDF Hunter report to %s...", output_path)
         
         try:
-            with open(output_path, "w") as f:
-                f.write(output.model_dump_json(indent=2))
-            print("[*] PDF Hunter report saved successfully.")
+            output_path.write_bytes(output.to_json(indent=True))
+            logger.info("[*] PDF Hunter report saved successfully.")
         except Exception as e:
-            print(f"[!] Failed to save PDF Hunter report: {str(e)}")
+            logger.error("[!] Failed to save PDF Hunter report: %s", e)
             # Don't fail the entire process if saving fails
         
         return output
         
     except Exception as e:
         error_msg = f"Final aggregation failed: {str(e)}"
-        print(f"❌ {error_msg}")
+        logger.error("❌ %s", error_msg)
         
         # Return a failure result
         return PDFHunterOutput(
             success=False,
             pdf_path=state.get("pdf_path", "unknown"),
-            pdf_processing_errors=safe_get(pdf_result, "errors", []) if 'pdf_result' in locals() else [],
-            forensic_analysis_errors=safe_get(forensic_result, "errors", []) if 'forensic_result' in locals() else [],
-            visual_analysis_errors=safe_get(visual_result, "errors", []) if 'visual_result' in locals() else [],
+            pdf_processing_errors=pdf_result.errors if pdf_result else [],
+            forensic_analysis_errors=forensic_result.errors if forensic_result else [],
+            visual_analysis_errors=visual_result.errors if visual_result else [],
             total_processing_time=None
         )
 
 
-def create_pdf_hunter_graph() -> StateGraph:
+def route_analyses(state: PDFHunterState) -> List[str]:
+    """Fan out to the branches the run's mode needs (static analysis and/or PDF processing)."""
+    stages = ANALYSIS_MODE_STAGES[state.get("mode") or "full"]
+    return [stage for stage in ("static_analysis", "pdf_processing") if stage in stages]
+
+
+def route_after_pdf_processing(state: PDFHunterState) -> str:
+    """Continue to visual analysis unless the run's mode skips it."""
+    if "visual_analysis" in ANALYSIS_MODE_STAGES[state.get("mode") or "full"]:
+        return "visual_analysis"
+    return "final_aggregation"
+
+
+def create_pdf_hunter_graph() -> CompiledStateGraph:
     """
     Create the main PDF Hunter graph with subgraph composition.
     
     Enhanced Graph Flow:
-    START -> pdf_processing (subgraph) -> [static_analysis, visual_analysis] (parallel) -> final_aggregation -> END
+    START -> file_hashing -> static_analysis ----------------------------> final_aggregation -> END
+                          -> pdf_processing (subgraph) -> visual_analysis ->
+    
+    Static analysis only needs the PDF itself, so it runs in parallel with PDF
+    processing and visual analysis instead of waiting for PDF processing.
+    The input's mode can skip branches: "forensic_only" runs static analysis
+    alone and "extract_only" runs PDF processing alone.
     
     Input Schema: PDFHunterInput (user-facing fields only)
     Output Schema: PDFHunterOutput (comprehensive results)
@@ -487,19 +746,34 @@ def create_pdf_hunter_graph() -> StateGraph:
     )
     
     # Add nodes - note that subgraphs are added as node functions, not directly
-    builder.add_node("pdf_processing", pdf_processing_node)
-    builder.add_node("static_analysis", static_analysis_node)
-    builder.add_node("visual_analysis", visual_analysis_node)
-    builder.add_node("final_aggregation", final_aggregation_node)
+    builder.add_node("file_hashing", file_hashing_node)
+    # The subgraph nodes carry sync and async implementations: invoke() runs the
+    # sync ones, ainvoke()/astream() await the subgraphs concurrently
+    builder.add_node(
+        "pdf_processing",
+        RunnableLambda(pdf_processing_node, afunc=apdf_processing_node, name="pdf_processing")
+    )
+    builder.add_node(
+        "static_analysis",
+        RunnableLambda(static_analysis_node, afunc=astatic_analysis_node, name="static_analysis")
+    )
+    builder.add_node(
+        "visual_analysis",
+        RunnableLambda(visual_analysis_node, afunc=avisual_analysis_node, name="visual_analysis")
+    )
+    # Deferred: runs once, after every branch the mode started has finished
+    builder.add_node("final_aggregation", final_aggregation_node, defer=True)
     
     # Create the enhanced flow with parallel analysis
-    builder.add_edge(START, "pdf_processing")
+    builder.add_edge(START, "file_hashing")
     
-    # After PDF processing, run static and visual analysis in parallel
-    builder.add_edge("pdf_processing", "static_analysis")
-    builder.add_edge("pdf_processing", "visual_analysis")
+    # Static analysis runs alongside PDF processing; visual analysis needs its images
+    builder.add_conditional_edges("file_hashing", route_analyses, ["static_analysis", "pdf_processing"])
+    builder.add_conditional_edges(
+        "pdf_processing", route_after_pdf_processing, ["visual_analysis", "final_aggregation"]
+    )
     
-    # Both analysis nodes feed into final aggregation
+    # Final aggregation waits for whichever branches ran (they finish in different steps)
     builder.add_edge("static_analysis", "final_aggregation")
     builder.add_edge("visual_analysis", "final_aggregation")
     
@@ -509,12 +783,77 @@ def create_pdf_hunter_graph() -> StateGraph:
     return builder.compile()
 
 
-def process_pdf_with_hunter(input_data: PDFHunterInput) -> PDFHunterOutput:
+def _start_banner(input_data: PDFHunterInput) -> None:
+    """Log the pipeline start banner."""
+    logger.info("🚀 Starting PDF Hunter Analysis Pipeline")
+    logger.info("=" * 60)
+    logger.info("📁 PDF: %s", input_data.pdf_path)
+    logger.info("📄 Pages to process: %s", input_data.pages_to_process)
+    logger.info("📂 Output directory: %s", input_data.output_directory or 'auto-generated')
+
+
+def _initial_state(input_data: PDFHunterInput) -> Dict[str, Any]:
+    """Convert the validated input to the graph's initial state."""
+    return {
+        "pdf_path": input_data.pdf_path,
+        "pages_to_process": input_data.pages_to_process,
+        "output_directory": input_data.output_directory,
+        "mode": input_data.mode,
+        "pdf_processing_result": None,
+        "static_analysis_result": None,
+        "visual_analysis_result": None,
+        "precomputed_hashes": None,
+        "errors": []
+    }
+
+
+def _finalize_result(final_result: Any, total_time: float) -> PDFHunterOutput:
+    """Attach the processing time to the graph result and log the summary."""
+    # Update the processing time in the result without re-validating every
+    # IoC, image and URL just to set one scalar field
+    if isinstance(final_result, PDFHunterOutput):
+        updated_result = final_result.model_copy(update={"total_processing_time": total_time})
+    elif isinstance(final_result, dict):
+        # Convert dict to PDFHunterOutput and add processing time
+        updated_result = PDFHunterOutput.model_validate({**final_result, "total_processing_time": total_time})
+    else:
+        # Fallback handling
+        updated_result = final_result
+        if hasattr(updated_result, 'total_processing_time'):
+            updated_result.total_processing_time = total_time
+    
+    logger.info("=" * 60)
+    logger.info("🏁 PDF Hunter Analysis Complete!")
+    logger.info("⏱️  Total time: %.2fs", total_time)
+    logger.info("✅ Success: %s", updated_result.success)
+    if updated_result.forensic_verdict:
+        logger.info("🔍 Verdict: %s", updated_result.forensic_verdict.value)
+    # get_summary() builds a dict over every result; skip it unless it is logged
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("📊 Summary: %s", updated_result.get_summary())
+    
+    return updated_result
+
+
+# Progress callback: receives the node name and the state update it returned
+ProgressCallback = Callable[[str, Any], None]
+
+
+def process_pdf_with_hunter(
+    input_data: PDFHunterInput,
+    graph: Optional[CompiledStateGraph] = None,
+    on_progress: Optional[ProgressCallback] = None
+) -> PDFHunterOutput:
     """
     Process a PDF using the complete Hunter pipeline with both PDF processing and forensic analysis.
     
     Args:
         input_data: PDFHunterInput with validated input parameters
+        graph: Optional compiled graph to run instead of the module-level app
+            (e.g. for tests)
+        on_progress: Optional callback called as each node finishes with the
+            node name and its state update, so subgraph results (and errors)
+            can be used before the whole pipeline completes
         
     Returns:
         PDFHunterOutput with comprehensive analysis results
@@ -531,64 +870,144 @@ def process_pdf_with_hunter(input_data: PDFHunterInput) -> PDFHunterOutput:
         >>> print(f"Images extracted: {len(result.extracted_images)}")
         >>> print(f"Is suspicious: {result.is_suspicious()}")
     """
-    print("🚀 Starting PDF Hunter Analysis Pipeline")
-    print("=" * 60)
-    print(f"📁 PDF: {input_data.pdf_path}")
-    print(f"📄 Pages to process: {input_data.pages_to_process}")
-    print(f"📂 Output directory: {input_data.output_directory or 'auto-generated'}")
+    _start_banner(input_data)
     
-    # Create the processing graph
-    graph = create_pdf_hunter_graph()
+    # Reuse the graph compiled at import time instead of rebuilding it per PDF
+    graph = graph or app
     
     # Convert input to state format and execute
-    start_time = time.time()
-    
-    initial_state = {
-        "pdf_path": input_data.pdf_path,
-        "pages_to_process": input_data.pages_to_process,
-        "output_directory": input_data.output_directory,
-        "pdf_processing_result": None,
-        "static_analysis_result": None,
-        "visual_analysis_result": None,
-        "errors": []
-    }
+    start_time = time.perf_counter()
     
     # Execute the graph
-    final_result = graph.invoke(initial_state)
+    if on_progress is None:
+        final_result = graph.invoke(_initial_state(input_data))
+    else:
+        final_result = None
+        for mode, chunk in graph.stream(_initial_state(input_data), stream_mode=["updates", "values"]):
+            if mode == "updates":
+                for node_name, update in chunk.items():
+                    on_progress(node_name, update)
+            else:
+                # The last state is the final result
+                final_result = chunk
     
-    total_time = time.time() - start_time
+    return _finalize_result(final_result, time.perf_counter() - start_time)
+
+
+async def aprocess_pdf_with_hunter(
+    input_data: PDFHunterInput,
+    on_visual_token: Optional[Callable[[str], None]] = None,
+    graph: Optional[CompiledStateGraph] = None,
+    on_progress: Optional[ProgressCallback] = None
+) -> PDFHunterOutput:
+    """
+    Async version of process_pdf_with_hunter.
     
-    # Update the processing time in the result
-    if isinstance(final_result, PDFHunterOutput):
-        # Update the processing time
-        result_dict = final_result.model_dump()
-        result_dict.pop('total_processing_time', None)  # Remove existing value
-        updated_result = PDFHunterOutput(
-            **result_dict,
-            total_processing_time=total_time
-        )
-    elif isinstance(final_result, dict):
-        # Convert dict to PDFHunterOutput and add processing time
-        final_result.pop('total_processing_time', None)  # Remove if exists
-        updated_result = PDFHunterOutput(
-            **final_result,
-            total_processing_time=total_time
-        )
+    The static and visual analysis branches are scheduled concurrently on the
+    event loop, so their LLM calls overlap instead of running back to back.
+    
+    Args:
+        input_data: PDFHunterInput with validated input parameters
+        on_visual_token: Optional callback receiving visual analysis tokens as
+            they are generated
+        graph: Optional compiled graph to run instead of the module-level app
+        on_progress: Optional callback called as each node finishes with the
+            node name and its state update
+        
+    Returns:
+        PDFHunterOutput with comprehensive analysis results
+        
+    Example:
+        >>> import asyncio
+        >>> result = asyncio.run(aprocess_pdf_with_hunter(
+        ...     input_data, on_visual_token=lambda t: print(t, end="")
+        ... ))
+    """
+    _start_banner(input_data)
+    
+    graph = graph or app
+    start_time = time.perf_counter()
+    initial_state = _initial_state(input_data)
+    
+    if on_visual_token is None and on_progress is None:
+        final_result = await graph.ainvoke(initial_state)
     else:
-        # Fallback handling
-        updated_result = final_result
-        if hasattr(updated_result, 'total_processing_time'):
-            updated_result.total_processing_time = total_time
+        stream_mode = ["values"]
+        if on_visual_token is not None:
+            stream_mode.append("messages")
+        if on_progress is not None:
+            stream_mode.append("updates")
+        
+        final_result = None
+        # subgraphs=True is needed to see the visual analyst's tokens; subgraph
+        # states and updates are skipped below
+        async for namespace, mode, chunk in graph.astream(
+            initial_state,
+            stream_mode=stream_mode,
+            subgraphs=True
+        ):
+            if mode == "messages":
+                message, metadata = chunk
+                if metadata.get("langgraph_node") == "visual_analysis" and message.content:
+                    on_visual_token(message.content)
+            elif namespace:
+                # Subgraph-internal states and updates
+                continue
+            elif mode == "updates":
+                for node_name, update in chunk.items():
+                    on_progress(node_name, update)
+            else:
+                # Root graph state; the last one is the final result
+                final_result = chunk
     
-    print("=" * 60)
-    print(f"🏁 PDF Hunter Analysis Complete!")
-    print(f"⏱️  Total time: {total_time:.2f}s")
-    print(f"✅ Success: {updated_result.success}")
-    if updated_result.forensic_verdict:
-        print(f"🔍 Verdict: {updated_result.forensic_verdict.value}")
-    print(f"📊 Summary: {updated_result.get_summary()}")
+    return _finalize_result(final_result, time.perf_counter() - start_time)
+
+
+async def aprocess_pdfs_with_hunter(
+    inputs: List[PDFHunterInput],
+    concurrency: int = 8,
+    graph: Optional[CompiledStateGraph] = None
+) -> List[PDFHunterOutput]:
+    """
+    Process a batch of PDFs concurrently with the complete Hunter pipeline.
     
-    return updated_result
+    Each pipeline spends most of its time waiting on LLM calls, so running
+    several at once scales throughput until the provider's rate limits are hit.
+    
+    Args:
+        inputs: PDFHunterInput for each PDF to analyze
+        concurrency: Maximum number of PDFs analyzed at the same time
+        graph: Optional compiled graph to run instead of the module-level app
+        
+    Returns:
+        PDFHunterOutput for each input, in the same order as ``inputs``
+        
+    Example:
+        >>> import asyncio, pathlib
+        >>> inputs = [PDFHunterInput(pdf_path=str(p)) for p in pathlib.Path("samples").glob("*.pdf")]
+        >>> results = asyncio.run(aprocess_pdfs_with_hunter(inputs, concurrency=4))
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    async def _process_one(input_data: PDFHunterInput) -> PDFHunterOutput:
+        async with semaphore:
+            return await aprocess_pdf_with_hunter(input_data, graph=graph)
+    
+    return await asyncio.gather(*(_process_one(input_data) for input_data in inputs))
+
+
+def process_pdfs_with_hunter(
+    inputs: List[PDFHunterInput],
+    concurrency: int = 8,
+    graph: Optional[CompiledStateGraph] = None
+) -> List[PDFHunterOutput]:
+    """
+    Synchronous wrapper around aprocess_pdfs_with_hunter.
+    
+    Must not be called from a running event loop; await
+    aprocess_pdfs_with_hunter there instead.
+    """
+    return asyncio.run(aprocess_pdfs_with_hunter(inputs, concurrency=concurrency, graph=graph))
 
 
 # Export the app for LangGraph Studio
@@ -597,6 +1016,9 @@ app = create_pdf_hunter_graph()
 
 def main():
     """Main function for testing the PDF Hunter graph."""
+    # Show the nodes' progress messages alongside the printed output
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+    
     print("PDF Hunter Main Graph - Test Execution")
     print("=" * 60)
     
@@ -0,0 +1,103 @@
+"""
+Result Cache for the PDF Hunter Main Graph
+
+Subgraph outputs are stored as JSON under ``<output_directory>/.pdf_hunter_cache/``
+keyed by the subgraph name, the SHA-256 of the PDF contents and the inputs that
+affect the result (e.g. pages_to_process). Re-running the pipeline on the same
+file then loads the previous outputs instead of invoking the subgraphs (and the
+LLMs behind them) again.
+
+Only successful results are cached. Set PDF_HUNTER_RESULT_CACHE=0 to disable, or
+PDF_HUNTER_RESULT_CACHE_DIR to share one cache directory across output directories
+(so duplicate files in a batch are only analyzed once).
+"""
+
+import hashlib
+import logging
+import os
+import pathlib
+from typing import Optional, Type, TypeVar
+
+from pydantic import BaseModel
+
+CACHE_DIRNAME = ".pdf_hunter_cache"
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+logger = logging.getLogger(__name__)
+
+
+def result_cache_enabled() -> bool:
+    """Check whether the result cache is enabled via PDF_HUNTER_RESULT_CACHE."""
+    return os.getenv("PDF_HUNTER_RESULT_CACHE", "1").strip().lower() not in ("0", "false", "no", "off")
+
+
+def cache_key(subgraph_name: str, pdf_sha256: str, *params) -> str:
+    """Build the cache key for a subgraph run over a given PDF."""
+    raw_key = ":".join([subgraph_name, pdf_sha256, *(str(p) for p in params)])
+    return hashlib.sha256(raw_key.encode("utf-8")).hexdigest()
+
+
+def _cache_path(output_directory: Optional[str], subgraph_name: str, key: str) -> pathlib.Path:
+    shared_dir = os.getenv("PDF_HUNTER_RESULT_CACHE_DIR")
+    if shared_dir:
+        return pathlib.Path(shared_dir) / f"{subgraph_name}_{key}.json"
+    base_dir = pathlib.Path(output_directory) if output_directory and output_directory.strip() else pathlib.Path(".")
+    return base_dir / CACHE_DIRNAME / f"{subgraph_name}_{key}.json"
+
+
+def load_cached_result(
+    output_directory: Optional[str],
+    subgraph_name: str,
+    key: Optional[str],
+    model_cls: Type[ModelT]
+) -> Optional[ModelT]:
+    """
+    Load a cached subgraph result.
+
+    Results whose extracted images are no longer on disk count as a miss.
+
+    Returns:
+        The cached result as ``model_cls``, or None on a miss (or if disabled)
+    """
+    if not key or not result_cache_enabled():
+        return None
+
+    cache_path = _cache_path(output_directory, subgraph_name, key)
+    if not cache_path.exists():
+        return None
+
+    try:
+        result = model_cls.model_validate_json(cache_path.read_bytes())
+    except Exception as e:
+        logger.warning("[!] Ignoring unreadable cache entry %s: %s", cache_path, e)
+        return None
+
+    # Extracted images point at files in the output directory of the run that
+    # saved them. If those were removed (e.g. a shared cache entry whose output
+    # directory was cleaned up) the result has to be produced again
+    if not all(pathlib.Path(image.saved_path).exists() for image in getattr(result, "extracted_images", []) if image.saved_path):
+        logger.info("[*] Ignoring cached %s result with missing saved images", subgraph_name)
+        return None
+
+    logger.info("[*] Loaded cached %s result from %s", subgraph_name, cache_path)
+    return result
+
+
+def save_cached_result(
+    output_directory: Optional[str],
+    subgraph_name: str,
+    key: Optional[str],
+    result: BaseModel
+) -> None:
+    """Store a successful subgraph result in the cache."""
+    if not key or not result_cache_enabled() or not getattr(result, "success", False):
+        return
+
+    cache_path = _cache_path(output_directory, subgraph_name, key)
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(result.model_dump_json())
+    except Exception as e:
+        # Caching is an optimization; never fail the analysis because of it
+        logger.warning("[!] Failed to cache %s result: %s", subgraph_name, e)
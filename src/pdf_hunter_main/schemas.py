@@ -5,9 +5,9 @@ This module defines the state schemas for the composed LangGraph that integrates
 PDF processing and static analysis as subgraphs.
 """
 
-import operator
-from typing import List, Dict, Optional, Any
-from pydantic import BaseModel, Field, field_validator
+from typing import List, Dict, Literal, Optional, Any
+import orjson
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from typing_extensions import Annotated, TypedDict
 
 # Import schemas from subgraphs
@@ -16,13 +16,30 @@ from static_analysis.schemas import ForensicCaseFileOutput, Verdict, AnalysisPha
 from visual_analysis.schemas import VisualAnalysisOutput, DeceptionTactic, BenignSignal, PrioritizedURL
 
 
+# Which analyses a run performs:
+#   full          - PDF processing, visual analysis and static analysis
+#   forensic_only - static analysis only (just the forensic verdict)
+#   extract_only  - PDF processing only (hashes, images and URLs)
+AnalysisMode = Literal["full", "forensic_only", "extract_only"]
+
+# Subgraph nodes each analysis mode runs
+ANALYSIS_MODE_STAGES: Dict[str, tuple] = {
+    "full": ("pdf_processing", "static_analysis", "visual_analysis"),
+    "forensic_only": ("static_analysis",),
+    "extract_only": ("pdf_processing",),
+}
+
+
 class PDFHunterInput(BaseModel):
     """
     Input model for the PDF Hunter Main Graph.
     
     This is the user-facing input schema for the composed graph.
     """
-    pdf_path: str = Field(..., description="Path to the PDF file to analyze", min_length=1)
+    # Read-only once validated; the core schema is built on first use, not at import
+    model_config = ConfigDict(frozen=True, defer_build=True)
+    
+    pdf_path: str = Field(..., description="Path to the PDF file to analyze")
     pages_to_process: Optional[int] = Field(
         1, 
         description="Number of pages to process from the beginning (1-based). Default is 1 (first page only)",
@@ -32,6 +49,10 @@ class PDFHunterInput(BaseModel):
         None, 
         description="Directory to save extracted images. If not provided, will create './extracted_images_<timestamp>'"
     )
+    mode: AnalysisMode = Field(
+        "full",
+        description="Analyses to run: 'full', 'forensic_only' (verdict only) or 'extract_only' (no LLM analysis)"
+    )
     
     @field_validator('pdf_path')
     @classmethod
@@ -41,14 +62,21 @@ class PDFHunterInput(BaseModel):
         if not v:
             raise ValueError('PDF path cannot be empty')
         
-        from pathlib import Path
-        path_obj = Path(v)
-        if path_obj.suffix.lower() != '.pdf':
+        # A plain suffix check; no Path object is needed per input
+        if not v.lower().endswith('.pdf'):
             raise ValueError('File must have .pdf extension')
         
         return v
 
 
+def merge_errors(existing: List[str], new: List[str]) -> List[str]:
+    """
+    Reducer for the state's error list: appends new errors, dropping ones already
+    recorded (e.g. the same failure reported by both parallel branches).
+    """
+    return list(dict.fromkeys([*existing, *new]))
+
+
 class PDFHunterState(TypedDict):
     """
     State for the PDF Hunter Main Graph.
@@ -59,6 +87,14 @@ class PDFHunterState(TypedDict):
     pdf_path: str
     pages_to_process: Optional[int]
     output_directory: Optional[str]
+    mode: Optional[AnalysisMode]
+    
+    # Absolute report directory, resolved and created once per run by file_hashing_node
+    resolved_output_dir: Optional[str]
+    
+    # SHA-1, MD5 and SHA-256 of the PDF contents, calculated once and shared with
+    # the subgraphs (the SHA-256 also keys cached subgraph results)
+    precomputed_hashes: Optional[Dict[str, str]]
     
     # Results from PDF processing subgraph
     pdf_processing_result: Optional[PDFProcessingOutput]
@@ -69,8 +105,14 @@ class PDFHunterState(TypedDict):
     # Results from visual analysis subgraph
     visual_analysis_result: Optional[VisualAnalysisOutput]
     
-    # Error tracking
-    errors: Annotated[List[str], operator.add]
+    # Error tracking (each distinct error is kept once, in first-seen order).
+    # The result fields above keep LangGraph's default single-writer channel:
+    # each branch writes its own key, and a second write in one step is an error.
+    errors: Annotated[List[str], merge_errors]
+
+
+# Forensic verdicts that make a PDF suspicious
+SUSPICIOUS_VERDICTS = frozenset({Verdict.SUSPICIOUS, Verdict.MALICIOUS})
 
 
 class PDFHunterOutput(BaseModel):
@@ -78,7 +120,10 @@ class PDFHunterOutput(BaseModel):
     Output model for the PDF Hunter Main Graph.
     
     This combines results from both PDF processing and static analysis.
+    The result is immutable; use model_copy(update=...) to derive a changed copy.
     """
+    model_config = ConfigDict(frozen=True, defer_build=True)
+    
     success: bool = Field(..., description="Whether the overall analysis was successful")
     pdf_path: str = Field(..., description="Path to the analyzed PDF file")
     
@@ -122,16 +167,29 @@ class PDFHunterOutput(BaseModel):
     forensic_analysis_errors: List[str] = Field(default_factory=list, description="Errors from forensic analysis")
     visual_analysis_errors: List[str] = Field(default_factory=list, description="Errors from visual analysis")
     
-    # Convenience properties for visual analysis access
-    @property
-    def visual_analysis_result(self) -> Optional[VisualAnalysisOutput]:
-        """Get the complete visual analysis result."""
-        # This will be set in the state and accessible through the final result
-        return getattr(self, '_visual_analysis_result', None)
+    # Complete visual analysis result; kept out of serialized reports, which
+    # already carry the visual_* summary fields above
+    visual_analysis_result: Optional[VisualAnalysisOutput] = Field(
+        None,
+        exclude=True,
+        description="Complete visual analysis result"
+    )
+    
+    def to_json(self, indent: bool = False) -> bytes:
+        """
+        Serialize the result to JSON with orjson, which encodes large results
+        (many IoCs, images and URLs) much faster than model_dump_json.
+        
+        Args:
+            indent: Pretty-print with two-space indentation
+        """
+        # mode="json" already turns enums and other non-JSON types into plain values
+        return orjson.dumps(self.model_dump(mode="json"), option=orjson.OPT_INDENT_2 if indent else None)
     
     # Summary methods
     def get_summary(self) -> Dict[str, Any]:
         """Get a comprehensive summary of all analysis results."""
+        visual = self.visual_analysis_result
         return {
             "success": self.success,
             "pdf_file": self.pdf_path,
@@ -158,22 +216,29 @@ class PDFHunterOutput(BaseModel):
             
             # Visual Analysis Summary
             "visual_analysis": {
-                "available": self.visual_analysis_result is not None,
-                "verdict": self.visual_analysis_result.overall_verdict if self.visual_analysis_result else None,
-                "confidence": self.visual_analysis_result.overall_confidence if self.visual_analysis_result else None,
-                "pages_analyzed": self.visual_analysis_result.total_pages_analyzed if self.visual_analysis_result else 0,
-                "deception_tactics": len(self.visual_analysis_result.all_deception_tactics) if self.visual_analysis_result else 0,
-                "benign_signals": len(self.visual_analysis_result.all_benign_signals) if self.visual_analysis_result else 0,
-                "high_priority_urls": len(self.visual_analysis_result.high_priority_urls) if self.visual_analysis_result else 0,
+                "available": False,
+                "verdict": None,
+                "confidence": None,
+                "pages_analyzed": 0,
+                "deception_tactics": 0,
+                "benign_signals": 0,
+                "high_priority_urls": 0,
+                "analysis_errors": len(self.visual_analysis_errors)
+            } if visual is None else {
+                "available": True,
+                "verdict": visual.overall_verdict,
+                "confidence": visual.overall_confidence,
+                "pages_analyzed": visual.total_pages_analyzed,
+                "deception_tactics": len(visual.all_deception_tactics),
+                "benign_signals": len(visual.all_benign_signals),
+                "high_priority_urls": len(visual.high_priority_urls),
                 "analysis_errors": len(self.visual_analysis_errors)
             }
         }
     
     def is_suspicious(self) -> bool:
         """Check if the PDF is considered suspicious based on forensic analysis."""
-        if not self.forensic_verdict:
-            return False
-        return self.forensic_verdict in [Verdict.SUSPICIOUS, Verdict.MALICIOUS]
+        return self.forensic_verdict in SUSPICIOUS_VERDICTS
     
     def has_artifacts(self) -> bool:
         """Check if any forensic artifacts were found."""
@@ -11,22 +11,14 @@ This package is designed to support the visual analysis agent by providing
 clean, efficient preprocessing capabilities.
 """
 
+import importlib
+
 from .hashing import (
     calculate_file_hashes,
     calculate_sha1,
     calculate_md5,
 )
 
-from .image_extraction import (
-    extract_first_page_image,
-    extract_first_page_as_pil,
-    extract_pages_as_base64_images,
-    save_image_with_sha1_filename,
-    calculate_image_phash,
-    get_pdf_page_count,
-    get_pdf_page_dimensions,
-)
-
 from .utils import (
     validate_pdf_path,
     ensure_output_directory,
@@ -40,14 +32,6 @@ from .utils import (
     HashCalculationError,
 )
 
-from .url_extraction import (
-    extract_urls_from_pdf,
-    PDFURLExtractor,
-    URLMatch,
-    URLType,
-    URLExtractionError,
-)
-
 from .agent_schemas import (
     PDFProcessingState,
     PDFProcessingInput,
@@ -57,12 +41,6 @@ from .agent_schemas import (
     ExtractedURL,
 )
 
-from .pdf_agent import (
-    process_pdf_with_agent,
-    process_pdf_with_agent_legacy,
-    create_pdf_processing_graph,
-)
-
 __version__ = "0.1.0"
 __author__ = "PDF Agent Team"
 
@@ -76,8 +54,16 @@ __all__ = [
     "extract_first_page_image",
     "extract_first_page_as_pil",
     "extract_pages_as_base64_images",
+    "iter_pages_as_base64_images",
+    "iter_pages_as_image_bytes",
+    "iter_pages_as_pil_images",
     "save_image_with_sha1_filename",
+    "iter_pages_saved_with_sha1_filenames",
+    "save_pages_with_sha1_filenames_parallel",
     "calculate_image_phash",
+    "calculate_image_phashes",
+    "image_phash_pixels",
+    "calculate_phashes_from_pixels",
     "get_pdf_page_count",
     "get_pdf_page_dimensions",
     
@@ -97,6 +83,8 @@ __all__ = [
     
     # PDF Agent
     "process_pdf_with_agent",
+    "aprocess_pdf_with_agent",
+    "clear_processing_cache",
     "process_pdf_with_agent_legacy",
     "create_pdf_processing_graph",
     
@@ -114,4 +102,43 @@ __all__ = [
     "ImageExtractionError",
     "HashCalculationError",
     "URLExtractionError",
-]
\ No newline at end of file
+]
+
+
+# Image and URL extraction (PyMuPDF, Pillow, imagehash) and the LangGraph
+# agent are imported on first access, so importing the hashing utilities or
+# the schemas does not load them
+_LAZY_IMPORTS = {
+    "extract_urls_from_pdf": ".url_extraction",
+    "PDFURLExtractor": ".url_extraction",
+    "URLMatch": ".url_extraction",
+    "URLType": ".url_extraction",
+    "URLExtractionError": ".url_extraction",
+    "extract_first_page_image": ".image_extraction",
+    "extract_first_page_as_pil": ".image_extraction",
+    "extract_pages_as_base64_images": ".image_extraction",
+    "iter_pages_as_base64_images": ".image_extraction",
+    "iter_pages_as_image_bytes": ".image_extraction",
+    "iter_pages_as_pil_images": ".image_extraction",
+    "PARALLEL_RENDER_MIN_PAGES": ".image_extraction",
+    "save_image_with_sha1_filename": ".image_extraction",
+    "iter_pages_saved_with_sha1_filenames": ".image_extraction",
+    "save_pages_with_sha1_filenames_parallel": ".image_extraction",
+    "calculate_image_phash": ".image_extraction",
+    "calculate_image_phashes": ".image_extraction",
+    "image_phash_pixels": ".image_extraction",
+    "calculate_phashes_from_pixels": ".image_extraction",
+    "get_pdf_page_count": ".image_extraction",
+    "get_pdf_page_dimensions": ".image_extraction",
+    "process_pdf_with_agent": ".pdf_agent",
+    "aprocess_pdf_with_agent": ".pdf_agent",
+    "clear_processing_cache": ".pdf_agent",
+    "process_pdf_with_agent_legacy": ".pdf_agent",
+    "create_pdf_processing_graph": ".pdf_agent",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        return getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
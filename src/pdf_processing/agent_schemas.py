@@ -8,13 +8,37 @@ URL extraction, and perceptual hashing.
 UPDATED: Enhanced with proper Pydantic validation and field validators.
 """
 
+import base64
 import operator
-from typing import List, Dict, Optional
+import re
+import time
+from typing import Any, BinaryIO, List, Dict, Literal, Optional
 from pathlib import Path
-from pydantic import BaseModel, Field, field_validator, model_validator
+import orjson
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator, model_validator
 from typing_extensions import Annotated, TypedDict
 
 
+# Accepted values for ExtractedImage.format and ExtractedURL.url_type (lower-case)
+ALLOWED_IMAGE_FORMATS = frozenset({'png', 'jpg', 'jpeg', 'gif', 'bmp', 'tiff', 'webp'})
+ALLOWED_URL_TYPES = frozenset({'annotation', 'text', 'link', 'embedded'})
+
+# Each accepted url_type mapped to itself, so validated URLs share these string
+# objects instead of each holding its own lower-cased copy
+_URL_TYPE_VALUES = {url_type: url_type for url_type in ALLOWED_URL_TYPES}
+
+# A URL must start with a known scheme, "www." or "/", or contain an "@"
+URL_FORMAT_PATTERN = re.compile(r'^(?:(?:https?|ftp|file)://|mailto:|www\.|/)|@')
+
+# Formats the agent can save extracted page images in
+ImageOutputFormat = Literal["png", "webp", "jpeg"]
+
+
+def _default_output_directory() -> str:
+    """Directory used for extracted images when the caller does not pick one."""
+    return f"./extracted_images_{int(time.time())}"
+
+
 class PDFHashData(BaseModel):
     """Hash information for the PDF file."""
     sha1: str = Field(..., description="SHA1 hash of the PDF file", min_length=40, max_length=40)
@@ -35,12 +59,26 @@ class PDFHashData(BaseModel):
         if not v.isalnum():
             raise ValueError('MD5 hash must contain only alphanumeric characters')
         return v.lower()
+    
+    @classmethod
+    def from_hexdigest(cls, sha1: str, md5: str) -> 'PDFHashData':
+        """
+        Build hash data from hashlib hexdigests without running the validators.
+        
+        hexdigest() always returns lowercase hex of the right length, so the
+        format checks above cannot fail for these values.
+        """
+        return cls.model_construct(sha1=sha1, md5=md5)
 
 
 class ExtractedImage(BaseModel):
     """Information about an extracted image."""
     page_number: int = Field(..., description="Page number the image was extracted from (0-based)", ge=0)
-    base64_data: str = Field(..., description="Base64-encoded image data", min_length=1)
+    base64_data: Optional[str] = Field(
+        None,
+        description="Base64-encoded image data. May be omitted when saved_path points at the image file",
+        min_length=1
+    )
     format: str = Field(..., description="Image format (e.g., 'png', 'jpg')")
     phash: Optional[str] = Field(None, description="Perceptual hash of the image")
     saved_path: Optional[str] = Field(None, description="Path where the image was saved with SHA1 filename")
@@ -50,9 +88,8 @@ class ExtractedImage(BaseModel):
     @classmethod
     def validate_format(cls, v: str) -> str:
         """Validate image format."""
-        allowed_formats = {'png', 'jpg', 'jpeg', 'gif', 'bmp', 'tiff'}
-        if v.lower() not in allowed_formats:
-            raise ValueError(f'Image format must be one of: {", ".join(allowed_formats)}')
+        if v.lower() not in ALLOWED_IMAGE_FORMATS:
+            raise ValueError(f'Image format must be one of: {", ".join(sorted(ALLOWED_IMAGE_FORMATS))}')
         return v.upper()
     
     @field_validator('saved_path')
@@ -62,11 +99,33 @@ class ExtractedImage(BaseModel):
         if v is not None and not Path(v).suffix:
             raise ValueError('Saved path should include file extension')
         return v
+    
+    @model_validator(mode='after')
+    def validate_image_source(self) -> 'ExtractedImage':
+        """Require either inline image data or a saved image file to load it from."""
+        if self.base64_data is None and self.saved_path is None:
+            raise ValueError('Either base64_data or saved_path must be provided')
+        return self
+    
+    def get_base64_data(self) -> str:
+        """Return the base64 image data, reading it from saved_path if it is not held inline."""
+        if self.base64_data is not None:
+            return self.base64_data
+        return base64.b64encode(Path(self.saved_path).read_bytes()).decode('utf-8')
+    
+    def without_inline_data(self) -> 'ExtractedImage':
+        """
+        Return a copy that references the saved image file instead of carrying
+        the base64 data, or this image unchanged if it was never saved.
+        """
+        if self.saved_path is None or self.base64_data is None:
+            return self
+        return self.model_copy(update={"base64_data": None})
 
 
 class ExtractedURL(BaseModel):
     """Information about an extracted URL."""
-    url: str = Field(..., description="The extracted URL", min_length=1)
+    url: str = Field(..., description="The extracted URL")
     page_number: int = Field(..., description="Page number where the URL was found", ge=0)
     url_type: str = Field(..., description="Type of URL (annotation or text)")
     coordinates: Optional[Dict[str, float]] = Field(None, description="Coordinates of the URL if from annotation")
@@ -77,8 +136,7 @@ class ExtractedURL(BaseModel):
     def validate_url(cls, v: str) -> str:
         """Basic URL validation."""
         # Basic URL validation - could be enhanced with more sophisticated checks
-        if not (v.startswith(('http://', 'https://', 'ftp://', 'mailto:', 'file://')) or 
-                v.startswith(('www.', '/')) or '@' in v):
+        if not URL_FORMAT_PATTERN.search(v):
             raise ValueError('URL must be a valid URL format')
         return v.strip()
     
@@ -86,10 +144,14 @@ class ExtractedURL(BaseModel):
     @classmethod
     def validate_url_type(cls, v: str) -> str:
         """Validate URL type."""
-        allowed_types = {'annotation', 'text', 'link', 'embedded'}
-        if v.lower() not in allowed_types:
-            raise ValueError(f'URL type must be one of: {", ".join(allowed_types)}')
-        return v.lower()
+        url_type = _URL_TYPE_VALUES.get(v.lower())
+        if url_type is None:
+            raise ValueError(f'URL type must be one of: {", ".join(sorted(ALLOWED_URL_TYPES))}')
+        return url_type
+
+
+# Validates a whole page's worth of extracted URLs in one call; built once at import
+URL_LIST_ADAPTER = TypeAdapter(List[ExtractedURL])
 
 
 class PDFProcessingState(TypedDict):
@@ -109,6 +171,7 @@ class PDFProcessingState(TypedDict):
     pdf_path: str  # Path to the PDF file to process
     pages_to_process: Optional[List[int]]  # Actual 0-based page numbers to process (converted from input count)
     output_directory: str  # Directory to save extracted images (auto-generated if needed)
+    output_format: ImageOutputFormat  # Format the extracted images are saved in
     
     # PDF metadata (set by validation node)
     pdf_hash: Optional[PDFHashData]  # Hash data for the PDF file
@@ -129,16 +192,28 @@ class PDFProcessingInput(BaseModel):
     This model validates all input parameters before processing begins,
     ensuring type safety and catching common errors early.
     """
-    pdf_path: str = Field(..., description="Path to the PDF file to process", min_length=1)
+    # The core schema is built on first use, not at import. Not frozen: the
+    # validator below fills in the default output directory
+    model_config = ConfigDict(defer_build=True)
+    
+    pdf_path: str = Field(..., description="Path to the PDF file to process")
     pages_to_process: Optional[int] = Field(
         1, 
         description="Number of pages to process from the beginning (1-based). Default is 1 (first page only)",
         ge=1
     )
     output_directory: Optional[str] = Field(
-        None, 
+        default_factory=_default_output_directory,
         description="Directory to save extracted images. If not provided, will create './extracted_images_<timestamp>'"
     )
+    output_format: ImageOutputFormat = Field(
+        "png",
+        description="Format to save extracted images in: 'png' (default), 'webp' (lossless, faster to encode) or 'jpeg' (lossy, fastest)"
+    )
+    pdf_hash: Optional[PDFHashData] = Field(
+        None,
+        description="Precomputed hash data for the PDF file. If not provided, the hashes are calculated during validation"
+    )
     
     @field_validator('pdf_path')
     @classmethod
@@ -148,9 +223,8 @@ class PDFProcessingInput(BaseModel):
         if not v:
             raise ValueError('PDF path cannot be empty')
         
-        # Check if path has PDF extension
-        path_obj = Path(v)
-        if path_obj.suffix.lower() != '.pdf':
+        # A plain suffix check; no Path object is needed per input
+        if not v.lower().endswith('.pdf'):
             raise ValueError('File must have .pdf extension')
         
         return v
@@ -165,26 +239,15 @@ class PDFProcessingInput(BaseModel):
     
     @field_validator('output_directory')
     @classmethod
-    def validate_output_directory(cls, v: Optional[str]) -> Optional[str]:
-        """Validate output directory path."""
-        if v is not None:
-            v = v.strip()
-            if not v:
-                raise ValueError('Output directory cannot be empty (use None for auto-generation)')
-            # Normalize path separators
-            return str(Path(v))
-        return v
-    
-    @model_validator(mode='after')
-    def validate_model(self) -> 'PDFProcessingInput':
-        """Final model validation and auto-generation of output directory."""
-        # Auto-generate output directory if not provided
-        if self.output_directory is None:
-            import time
-            timestamp = int(time.time())
-            self.output_directory = f"./extracted_images_{timestamp}"
-        
-        return self
+    def validate_output_directory(cls, v: Optional[str]) -> str:
+        """Validate output directory path, auto-generating it for an explicit None."""
+        if v is None:
+            return _default_output_directory()
+        v = v.strip()
+        if not v:
+            raise ValueError('Output directory cannot be empty (use None for auto-generation)')
+        # Normalize path separators
+        return str(Path(v))
 
 
 class PDFProcessingOutput(BaseModel):
@@ -194,6 +257,10 @@ class PDFProcessingOutput(BaseModel):
     This model guarantees the structure and types of all processing results,
     providing type safety for downstream consumers.
     """
+    # Read-only once built (use model_copy(update=...)); the core schema is
+    # built on first use, not at import
+    model_config = ConfigDict(frozen=True, defer_build=True)
+    
     success: bool = Field(..., description="Whether the overall processing was successful")
     pdf_path: str = Field(..., description="Path to the processed PDF file")
     pdf_hash: Optional[PDFHashData] = Field(None, description="Hash data for the PDF file")
@@ -231,36 +298,30 @@ class PDFProcessingOutput(BaseModel):
         if self.success and self.errors:
             raise ValueError('Processing cannot be successful if errors are present')
         
-        # If there are errors, success should be False
-        if self.errors and self.success:
-            raise ValueError('Success must be False when errors are present')
-        
-        # Validate extracted images page numbers against page count
-        if self.page_count is not None and self.extracted_images:
-            invalid_pages = [
-                img.page_number for img in self.extracted_images 
-                if img.page_number >= self.page_count
-            ]
-            if invalid_pages:
-                raise ValueError(
-                    f'Extracted images reference invalid page numbers: {invalid_pages}. '
-                    f'PDF only has {self.page_count} pages.'
-                )
+        if self.page_count is None:
+            return self
         
-        # Validate extracted URLs page numbers against page count
-        if self.page_count is not None and self.extracted_urls:
-            invalid_pages = [
-                url.page_number for url in self.extracted_urls 
-                if url.page_number >= self.page_count
-            ]
-            if invalid_pages:
+        # Validate extracted images and URLs page numbers against page count.
+        # One max() pass per list; the offending pages are only collected on failure
+        for label, items in (('images', self.extracted_images), ('URLs', self.extracted_urls)):
+            if items and max(item.page_number for item in items) >= self.page_count:
+                invalid_pages = [item.page_number for item in items if item.page_number >= self.page_count]
                 raise ValueError(
-                    f'Extracted URLs reference invalid page numbers: {invalid_pages}. '
+                    f'Extracted {label} reference invalid page numbers: {invalid_pages}. '
                     f'PDF only has {self.page_count} pages.'
                 )
         
         return self
     
+    @classmethod
+    def build_trusted(cls, **data: Any) -> 'PDFProcessingOutput':
+        """
+        Build the output from values the processing nodes already validated
+        (ExtractedImage / ExtractedURL / PDFHashData instances), skipping field
+        validation and running only the cross-field consistency checks.
+        """
+        return cls.model_construct(**data).validate_consistency()
+    
     def get_processing_summary(self) -> Dict[str, any]:
         """Get a summary of processing results."""
         return {
@@ -275,5 +336,12 @@ class PDFProcessingOutput(BaseModel):
     
     def to_json_summary(self) -> str:
         """Get a JSON summary of key metrics."""
-        import json
-        return json.dumps(self.get_processing_summary(), indent=2) 
\ No newline at end of file
+        return orjson.dumps(self.get_processing_summary(), option=orjson.OPT_INDENT_2).decode('utf-8')
+    
+    def write_json(self, fp: BinaryIO) -> None:
+        """
+        Write the full output as JSON to a binary file object.
+        
+        The result can be read back with ``PDFProcessingOutput.model_validate_json``.
+        """
+        fp.write(orjson.dumps(self.model_dump(mode="json")))
\ No newline at end of file
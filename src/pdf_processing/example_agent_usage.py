@@ -9,10 +9,11 @@ and perceptual hashing.
 UPDATED: Now shows proper Input/Output schema usage with Pydantic validation.
 """
 
-import json
 import time
 from pathlib import Path
 
+import orjson
+
 from pdf_processing import process_pdf_with_agent, process_pdf_with_agent_legacy, create_pdf_processing_graph
 from pdf_processing.agent_schemas import PDFProcessingInput, PDFProcessingOutput
 
@@ -178,7 +179,7 @@ def example_legacy_comparison():
     
     try:
         print("=== LEGACY APPROACH (Deprecated) ===")
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         # Legacy approach - still works but shows deprecation warning
         legacy_result = process_pdf_with_agent_legacy(
@@ -187,12 +188,12 @@ def example_legacy_comparison():
             output_directory="./demo_legacy"
         )
         
-        legacy_time = time.time() - start_time
+        legacy_time = time.perf_counter() - start_time
         print(f"✓ Legacy processing completed in {legacy_time:.2f}s")
         print(f"✓ Success: {legacy_result.success}")
         
         print("\n=== NEW SCHEMA APPROACH (Recommended) ===")
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         # New schema approach with validation
         input_data = PDFProcessingInput(
@@ -202,7 +203,7 @@ def example_legacy_comparison():
         )
         
         schema_result = process_pdf_with_agent(input_data)
-        schema_time = time.time() - start_time
+        schema_time = time.perf_counter() - start_time
         
         print(f"✓ Schema-based processing completed in {schema_time:.2f}s")
         print(f"✓ Success: {schema_result.success}")
@@ -260,10 +261,10 @@ def example_graph_visualization():
             print("Executing graph with schema-aware input...")
             print(f"Input type: {type(input_data).__name__}")
             
-            start_time = time.time()
+            start_time = time.perf_counter()
             # Graph automatically converts input schema to internal state and back to output schema
             result = graph.invoke(input_data)
-            execution_time = time.time() - start_time
+            execution_time = time.perf_counter() - start_time
             
             print(f"✅ Graph execution completed in {execution_time:.2f}s")
             print(f"✅ Output type: {type(result).__name__}")
@@ -339,20 +340,16 @@ def example_export_results():
         # Export to JSON with schema validation
         output_file = "pdf_processing_results.json"
         
-        # Convert Pydantic model to dictionary (maintains validation)
-        result_dict = result.model_dump()
-        
         # Add schema information to export
         export_data = {
             "schema_version": "1.0",
             "input_schema": "PDFProcessingInput",
             "output_schema": "PDFProcessingOutput", 
             "export_timestamp": time.time(),
-            "results": result_dict
+            "results": result.model_dump(mode="json")
         }
         
-        with open(output_file, 'w') as f:
-            json.dump(export_data, f, indent=2, default=str)
+        Path(output_file).write_bytes(orjson.dumps(export_data, option=orjson.OPT_INDENT_2))
         
         print(f"✓ Results exported to: {output_file}")
         print(f"✓ Schema information included in export")
@@ -361,8 +358,7 @@ def example_export_results():
         
         # Show how to reload and validate
         print(f"\n=== Reload and Validation Example ===")
-        with open(output_file, 'r') as f:
-            loaded_data = json.load(f)
+        loaded_data = orjson.loads(Path(output_file).read_bytes())
         
         # Recreate validated object from export
         reloaded_result = PDFProcessingOutput.model_validate(loaded_data["results"])
@@ -7,8 +7,13 @@ as a high-quality image using PyMuPDF (fitz).
 
 import io
 import base64
+import hashlib
+import multiprocessing
 import pathlib
-from typing import Union, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache, partial
+from typing import Dict, Iterator, List, Sequence, Union, Optional, Tuple
 from PIL import Image
 import pymupdf
 
@@ -20,6 +25,54 @@ except ImportError:
 from .hashing import calculate_sha1
 
 
+# Renders of at least this many pages are split across worker processes; for
+# fewer pages, starting the workers costs more than rendering in-process
+PARALLEL_RENDER_MIN_PAGES = 50
+
+# Pages rendered per worker task
+PARALLEL_RENDER_CHUNK_SIZE = 10
+
+# Encoder settings used by save_image_with_sha1_filename, tuned for encode
+# speed: WebP stays lossless but skips most of the compression search
+IMAGE_SAVE_OPTIONS = {
+    "WEBP": {"lossless": True, "method": 0, "quality": 0},
+    "JPEG": {"quality": 88},
+}
+
+
+@lru_cache(maxsize=4)
+def _render_page_pixmap(pdf_path: str, mtime_ns: int, page_num: int, dpi: int) -> pymupdf.Pixmap:
+    """
+    Render one page to a pixmap.
+    
+    Cached on the file's path and modification time, so extracting the first
+    page of an unchanged PDF again (as a file or as a PIL image) does not
+    render it again; editing the file changes mtime_ns and misses the cache.
+    """
+    doc = pymupdf.open(pdf_path)
+    try:
+        if len(doc) == 0:
+            raise ValueError("PDF document has no pages")
+        
+        # PyMuPDF uses 72 DPI as default, so scale = target_dpi / 72
+        scale = dpi / 72.0
+        return doc[page_num].get_pixmap(matrix=pymupdf.Matrix(scale, scale))
+    finally:
+        doc.close()
+
+
+@lru_cache(maxsize=8)
+def _render_page_bytes(pdf_path: str, mtime_ns: int, page_num: int, dpi: int, output: str) -> bytes:
+    """Render one page to encoded image bytes, reusing the cached pixmap."""
+    return _render_page_pixmap(pdf_path, mtime_ns, page_num, dpi).tobytes(output)
+
+
+def _pixmap_to_pil(pixmap: pymupdf.Pixmap) -> Image.Image:
+    """Build a PIL Image from a pixmap's raw samples, without a PNG encode/decode round trip."""
+    mode = "RGBA" if pixmap.alpha else "RGB"
+    return Image.frombytes(mode, (pixmap.width, pixmap.height), pixmap.samples)
+
+
 def extract_first_page_image(
     pdf_path: Union[str, pathlib.Path],
     output_path: Optional[Union[str, pathlib.Path]] = None,
@@ -65,30 +118,13 @@ def extract_first_page_image(
         output_path = pathlib.Path(output_path)
     
     try:
-        # Open PDF document
-        doc = pymupdf.open(str(pdf_path))
-        
-        if len(doc) == 0:
-            raise ValueError("PDF document has no pages")
-        
-        # Get first page
-        page = doc[0]
-        
-        # Calculate scale factor from DPI
-        # PyMuPDF uses 72 DPI as default, so scale = target_dpi / 72
-        scale = dpi / 72.0
-        
-        # Create transformation matrix for scaling
-        matrix = pymupdf.Matrix(scale, scale)
-        
-        # Render page to pixmap
-        pixmap = page.get_pixmap(matrix=matrix)
+        # Render the first page, encoded as the output file's extension asks
+        img_data = _render_page_bytes(
+            str(pdf_path), pdf_path.stat().st_mtime_ns, 0, dpi, output_path.suffix[1:].lower()
+        )
         
         # Save the image
-        pixmap.save(str(output_path))
-        
-        # Clean up
-        doc.close()
+        output_path.write_bytes(img_data)
         
         return str(output_path)
         
@@ -131,45 +167,26 @@ def extract_first_page_as_pil(
         raise ValueError("DPI must be positive")
     
     try:
-        # Open PDF document
-        doc = pymupdf.open(str(pdf_path))
-        
-        if len(doc) == 0:
-            raise ValueError("PDF document has no pages")
-        
-        # Get first page
-        page = doc[0]
-        
-        # Calculate scale factor from DPI
-        scale = dpi / 72.0
-        
-        # Create transformation matrix for scaling
-        matrix = pymupdf.Matrix(scale, scale)
-        
-        # Render page to pixmap
-        pixmap = page.get_pixmap(matrix=matrix)
-        
-        # Convert to PIL Image
-        img_data = pixmap.tobytes("png")
-        pil_image = Image.open(io.BytesIO(img_data))
-        
-        # Clean up
-        doc.close()
-        
-        return pil_image
+        # Render the first page (shared with extract_first_page_image) and
+        # convert to PIL Image straight from the pixel data
+        pixmap = _render_page_pixmap(str(pdf_path), pdf_path.stat().st_mtime_ns, 0, dpi)
+        return _pixmap_to_pil(pixmap)
         
     except Exception as e:
         raise RuntimeError(f"Error extracting image from PDF: {e}")
 
 
-def extract_pages_as_base64_images(
+def iter_pages_as_image_bytes(
     pdf_path: Union[str, pathlib.Path],
     pages: Optional[list] = None,
     dpi: int = 150,
     format: str = "PNG"
-) -> list:
+) -> Iterator[dict]:
     """
-    Extract specified pages from a PDF as base64-encoded images.
+    Render specified pages of a PDF as encoded image bytes, one page at a time.
+    
+    Pages are rendered as the caller iterates, so only one page's image is
+    held in memory unless the caller keeps them.
     
     Args:
         pdf_path: Path to the PDF file
@@ -177,8 +194,8 @@ def extract_pages_as_base64_images(
         dpi: Resolution in dots per inch (default: 150)
         format: Image format (default: "PNG")
         
-    Returns:
-        List of dictionaries containing page_number and base64_data
+    Yields:
+        Dictionaries containing page_number, image_bytes and format, in page order
         
     Raises:
         FileNotFoundError: If the PDF file does not exist
@@ -186,8 +203,8 @@ def extract_pages_as_base64_images(
         RuntimeError: If PDF cannot be opened or image cannot be extracted
         
     Example:
-        >>> images = extract_pages_as_base64_images("document.pdf", pages=[0, 1])
-        >>> print(f"Extracted {len(images)} images as base64")
+        >>> for image in iter_pages_as_image_bytes("document.pdf"):
+        ...     print(f"Page {image['page_number']}: {len(image['image_bytes'])} bytes")
     """
     pdf_path = pathlib.Path(pdf_path)
     
@@ -216,8 +233,6 @@ def extract_pages_as_base64_images(
                 if page_num < 0 or page_num >= len(doc):
                     raise ValueError(f"Invalid page number: {page_num}. Document has {len(doc)} pages.")
         
-        images = []
-        
         # Extract each page
         for page_num in pages:
             page = doc[page_num]
@@ -231,25 +246,164 @@ def extract_pages_as_base64_images(
             # Render page to pixmap
             pixmap = page.get_pixmap(matrix=matrix)
             
-            # Convert to base64
-            img_data = pixmap.tobytes(format.lower())
-            base64_data = base64.b64encode(img_data).decode('utf-8')
-            
-            images.append({
+            yield {
                 'page_number': page_num,
-                'base64_data': base64_data,
+                'image_bytes': pixmap.tobytes(format.lower()),
                 'format': format.lower()
-            })
+            }
         
         # Clean up
         doc.close()
         
-        return images
+    except Exception as e:
+        raise RuntimeError(f"Error extracting images from PDF: {e}")
+
+
+def iter_pages_as_pil_images(
+    pdf_path: Union[str, pathlib.Path],
+    pages: Optional[list] = None,
+    dpi: int = 150
+) -> Iterator[dict]:
+    """
+    Render specified pages of a PDF as PIL images, one page at a time.
+    
+    The images are built from the rendered pixels directly, so no encoding
+    happens until the caller saves them.
+    
+    Args:
+        pdf_path: Path to the PDF file
+        pages: List of page numbers to extract (0-based). If None, extracts all pages
+        dpi: Resolution in dots per inch (default: 150)
+        
+    Yields:
+        Dictionaries containing page_number, image (PIL Image) and pixel_sha1
+        (SHA1 digest of the raw pixels, equal for identically rendered pages),
+        in page order
+        
+    Raises:
+        FileNotFoundError: If the PDF file does not exist
+        ValueError: If the PDF has no pages or invalid parameters
+        RuntimeError: If PDF cannot be opened or image cannot be extracted
+        
+    Example:
+        >>> for page in iter_pages_as_pil_images("document.pdf"):
+        ...     page["image"].save(f"page_{page['page_number']}.png")
+    """
+    pdf_path = pathlib.Path(pdf_path)
+    
+    if not pdf_path.exists():
+        raise FileNotFoundError(f"PDF file not found: {pdf_path}")
+    
+    if not pdf_path.is_file():
+        raise ValueError(f"Path is not a file: {pdf_path}")
+    
+    if dpi <= 0:
+        raise ValueError("DPI must be positive")
+    
+    try:
+        # Open PDF document
+        doc = pymupdf.open(str(pdf_path))
+        
+        if len(doc) == 0:
+            raise ValueError("PDF document has no pages")
+        
+        # Determine pages to extract
+        if pages is None:
+            pages = list(range(len(doc)))
+        else:
+            # Validate page numbers
+            for page_num in pages:
+                if page_num < 0 or page_num >= len(doc):
+                    raise ValueError(f"Invalid page number: {page_num}. Document has {len(doc)} pages.")
+        
+        scale = dpi / 72.0
+        matrix = pymupdf.Matrix(scale, scale)
+        
+        # Extract each page
+        for page_num in pages:
+            pixmap = doc[page_num].get_pixmap(matrix=matrix)
+            
+            yield {
+                'page_number': page_num,
+                'image': _pixmap_to_pil(pixmap),
+                'pixel_sha1': hashlib.sha1(pixmap.samples_mv).digest()
+            }
+        
+        # Clean up
+        doc.close()
         
     except Exception as e:
         raise RuntimeError(f"Error extracting images from PDF: {e}")
 
 
+def iter_pages_as_base64_images(
+    pdf_path: Union[str, pathlib.Path],
+    pages: Optional[list] = None,
+    dpi: int = 150,
+    format: str = "PNG"
+) -> Iterator[dict]:
+    """
+    Extract specified pages from a PDF as base64-encoded images, one page at a time.
+    
+    Pages are rendered as the caller iterates, so only one page's image is
+    held in memory unless the caller keeps them.
+    
+    Args:
+        pdf_path: Path to the PDF file
+        pages: List of page numbers to extract (0-based). If None, extracts all pages
+        dpi: Resolution in dots per inch (default: 150)
+        format: Image format (default: "PNG")
+        
+    Yields:
+        Dictionaries containing page_number and base64_data, in page order
+        
+    Raises:
+        FileNotFoundError: If the PDF file does not exist
+        ValueError: If the PDF has no pages or invalid parameters
+        RuntimeError: If PDF cannot be opened or image cannot be extracted
+        
+    Example:
+        >>> for image in iter_pages_as_base64_images("document.pdf"):
+        ...     print(f"Page {image['page_number']}: {len(image['base64_data'])} chars")
+    """
+    for image in iter_pages_as_image_bytes(pdf_path, pages=pages, dpi=dpi, format=format):
+        yield {
+            'page_number': image['page_number'],
+            'base64_data': base64.b64encode(image['image_bytes']).decode('utf-8'),
+            'format': image['format']
+        }
+
+
+def extract_pages_as_base64_images(
+    pdf_path: Union[str, pathlib.Path],
+    pages: Optional[list] = None,
+    dpi: int = 150,
+    format: str = "PNG"
+) -> list:
+    """
+    Extract specified pages from a PDF as base64-encoded images.
+    
+    Args:
+        pdf_path: Path to the PDF file
+        pages: List of page numbers to extract (0-based). If None, extracts all pages
+        dpi: Resolution in dots per inch (default: 150)
+        format: Image format (default: "PNG")
+        
+    Returns:
+        List of dictionaries containing page_number and base64_data
+        
+    Raises:
+        FileNotFoundError: If the PDF file does not exist
+        ValueError: If the PDF has no pages or invalid parameters
+        RuntimeError: If PDF cannot be opened or image cannot be extracted
+        
+    Example:
+        >>> images = extract_pages_as_base64_images("document.pdf", pages=[0, 1])
+        >>> print(f"Extracted {len(images)} images as base64")
+    """
+    return list(iter_pages_as_base64_images(pdf_path, pages=pages, dpi=dpi, format=format))
+
+
 def save_image_with_sha1_filename(
     image: Image.Image,
     output_dir: Union[str, pathlib.Path],
@@ -261,7 +415,7 @@ def save_image_with_sha1_filename(
     Args:
         image: PIL Image object to save
         output_dir: Directory to save the image in
-        format: Image format (default: "PNG")
+        format: Image format, e.g. "PNG", "WEBP" or "JPEG" (default: "PNG")
         
     Returns:
         Path to the saved image file
@@ -286,19 +440,18 @@ def save_image_with_sha1_filename(
     try:
         # Convert image to bytes
         img_buffer = io.BytesIO()
-        image.save(img_buffer, format=format.upper())
+        image.save(img_buffer, format=format.upper(), **IMAGE_SAVE_OPTIONS.get(format.upper(), {}))
         img_bytes = img_buffer.getvalue()
         
         # Calculate SHA1 hash of image data
-        import hashlib
         sha1_hash = hashlib.sha1(img_bytes).hexdigest()
         
         # Create filename with SHA1 hash
         filename = f"{sha1_hash}.{format.lower()}"
         output_path = output_dir / filename
         
-        # Save the image
-        image.save(str(output_path), format=format.upper())
+        # Save the already-encoded bytes rather than encoding the image again
+        output_path.write_bytes(img_bytes)
         
         return str(output_path)
         
@@ -306,6 +459,120 @@ def save_image_with_sha1_filename(
         raise RuntimeError(f"Error saving image with SHA1 filename: {e}")
 
 
+def iter_pages_saved_with_sha1_filenames(
+    pdf_path: Union[str, pathlib.Path],
+    output_dir: Union[str, pathlib.Path],
+    pages: Optional[list] = None,
+    dpi: int = 150,
+    format: str = "PNG"
+) -> Iterator[dict]:
+    """
+    Render specified pages of a PDF and save each one with save_image_with_sha1_filename.
+    
+    Pages are rendered, saved and reduced to the small array their perceptual
+    hash is computed from (image_phash_pixels) one at a time, so no page image
+    is kept. A page whose pixels match an earlier page is not saved again and
+    shares its saved file.
+    
+    Args:
+        pdf_path: Path to the PDF file
+        output_dir: Directory to save the images in
+        pages: List of page numbers to extract (0-based). If None, extracts all pages
+        dpi: Resolution in dots per inch (default: 150)
+        format: Image format, e.g. "PNG", "WEBP" or "JPEG" (default: "PNG")
+        
+    Yields:
+        Dictionaries containing page_number, pixel_sha1, saved_path, phash_pixels
+        and phash_error (set, with phash_pixels None, if the phash array could not
+        be computed), in page order. A page that could not be saved has an error
+        instead of saved_path.
+        
+    Raises:
+        FileNotFoundError: If the PDF file does not exist
+        ValueError: If the PDF has no pages or invalid parameters
+        RuntimeError: If PDF cannot be opened or image cannot be extracted
+    """
+    saved_pages: Dict[bytes, dict] = {}
+    
+    for page in iter_pages_as_pil_images(pdf_path, pages=pages, dpi=dpi):
+        saved = saved_pages.get(page['pixel_sha1'])
+        if saved is None:
+            try:
+                saved_path = save_image_with_sha1_filename(page['image'], output_dir, format=format)
+            except Exception as e:
+                yield {'page_number': page['page_number'], 'pixel_sha1': page['pixel_sha1'], 'error': str(e)}
+                continue
+            
+            try:
+                saved = {'saved_path': saved_path, 'phash_pixels': image_phash_pixels(page['image']), 'phash_error': None}
+            except Exception as e:
+                saved = {'saved_path': saved_path, 'phash_pixels': None, 'phash_error': str(e)}
+            saved_pages[page['pixel_sha1']] = saved
+        
+        yield {'page_number': page['page_number'], 'pixel_sha1': page['pixel_sha1'], **saved}
+
+
+def _save_page_chunk(pdf_path: str, output_dir: str, pages: List[int], dpi: int, format: str) -> list:
+    """Worker task for save_pages_with_sha1_filenames_parallel."""
+    return list(iter_pages_saved_with_sha1_filenames(pdf_path, output_dir, pages=pages, dpi=dpi, format=format))
+
+
+def save_pages_with_sha1_filenames_parallel(
+    pdf_path: Union[str, pathlib.Path],
+    output_dir: Union[str, pathlib.Path],
+    pages: List[int],
+    dpi: int = 150,
+    format: str = "PNG",
+    chunk_size: int = PARALLEL_RENDER_CHUNK_SIZE,
+    max_workers: Optional[int] = None
+) -> list:
+    """
+    Save pages like iter_pages_saved_with_sha1_filenames, rendering, encoding
+    and saving chunks of pages in separate worker processes.
+    
+    PyMuPDF rendering and image encoding are CPU bound and hold the GIL, so
+    large page ranges only scale across processes. Each worker opens the PDF
+    itself, handles ``chunk_size`` pages per task and sends back only the page
+    records, never the images.
+    
+    Args:
+        pdf_path: Path to the PDF file
+        output_dir: Directory to save the images in
+        pages: List of page numbers to extract (0-based)
+        dpi: Resolution in dots per inch (default: 150)
+        format: Image format, e.g. "PNG", "WEBP" or "JPEG" (default: "PNG")
+        chunk_size: Pages handled per worker task (default: 10)
+        max_workers: Worker processes to start (default: one per CPU)
+        
+    Returns:
+        List of page dictionaries as yielded by iter_pages_saved_with_sha1_filenames,
+        in the same order as ``pages``
+        
+    Raises:
+        RuntimeError: If a chunk cannot be rendered
+    """
+    chunks = [pages[i:i + chunk_size] for i in range(0, len(pages), chunk_size)]
+    save_chunk = partial(_save_page_chunk, str(pdf_path), str(output_dir), dpi=dpi, format=format)
+    
+    workers = min(max_workers or multiprocessing.cpu_count(), len(chunks))
+    if workers < 2:
+        # A single worker would only add process start-up to the same work
+        return list(iter_pages_saved_with_sha1_filenames(pdf_path, output_dir, pages=pages, dpi=dpi, format=format))
+    
+    try:
+        # Spawned workers do not inherit the caller's threads (LangGraph runs nodes
+        # on a thread pool), which fork would copy in an inconsistent state
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn")
+        ) as pool:
+            return [page for chunk_pages in pool.map(save_chunk, chunks) for page in chunk_pages]
+    except BrokenProcessPool:
+        # Workers could not start (e.g. the caller's __main__ cannot be
+        # re-imported by a spawned process); save in this process instead
+        return list(iter_pages_saved_with_sha1_filenames(pdf_path, output_dir, pages=pages, dpi=dpi, format=format))
+
+
 def calculate_image_phash(image: Image.Image) -> str:
     """
     Calculate perceptual hash (phash) of a PIL Image.
@@ -337,6 +604,101 @@ def calculate_image_phash(image: Image.Image) -> str:
         raise RuntimeError(f"Error calculating perceptual hash: {e}")
 
 
+def image_phash_pixels(image: Image.Image, hash_size: int = 8):
+    """
+    Reduce a PIL Image to the small grayscale array its perceptual hash is computed from.
+    
+    This is the per-image part of calculate_image_phashes. Callers that hash many
+    large images can reduce each one as soon as they have it, drop the image and
+    hash all the arrays in one calculate_phashes_from_pixels call.
+    
+    Args:
+        image: PIL Image object to reduce
+        hash_size: Hash size in bits per side (default: 8, a 64-bit hash)
+        
+    Returns:
+        NumPy uint8 array of shape (4 * hash_size, 4 * hash_size)
+        
+    Raises:
+        ImportError: If imagehash library (and its NumPy dependency) is not installed
+    """
+    if imagehash is None:
+        raise ImportError("imagehash library is required for perceptual hashing. Install with: pip install imagehash")
+    
+    import numpy
+    
+    # Same preprocessing as imagehash.phash: grayscale, downscaled 4x the hash size
+    img_size = hash_size * 4
+    return numpy.asarray(image.convert('L').resize((img_size, img_size), Image.LANCZOS))
+
+
+def calculate_phashes_from_pixels(pixels: Sequence, hash_size: int = 8) -> List[str]:
+    """
+    Calculate perceptual hashes from arrays produced by image_phash_pixels.
+    
+    Runs the DCT and median comparison for all arrays as single NumPy/SciPy
+    operations.
+    
+    Args:
+        pixels: Arrays returned by image_phash_pixels (with the same hash_size)
+        hash_size: Hash size in bits per side (default: 8, a 64-bit hash)
+        
+    Returns:
+        Perceptual hashes as hexadecimal strings, in the same order as ``pixels``
+        
+    Raises:
+        ImportError: If imagehash library (and its NumPy/SciPy dependencies) is not installed
+        RuntimeError: If hash calculation fails
+    """
+    if imagehash is None:
+        raise ImportError("imagehash library is required for perceptual hashing. Install with: pip install imagehash")
+    if len(pixels) == 0:
+        return []
+    
+    import numpy
+    import scipy.fftpack
+    
+    try:
+        # 2-D DCT over every image in the batch, keeping the low frequencies
+        dct = scipy.fftpack.dct(scipy.fftpack.dct(numpy.stack(pixels), axis=1), axis=2)
+        lowfreq = dct[:, :hash_size, :hash_size].reshape(len(pixels), -1)
+        bits = lowfreq > numpy.median(lowfreq, axis=1, keepdims=True)
+        
+        return [row.tobytes().hex() for row in numpy.packbits(bits, axis=1)]
+        
+    except Exception as e:
+        raise RuntimeError(f"Error calculating perceptual hashes: {e}")
+
+
+def calculate_image_phashes(images: Sequence[Image.Image], hash_size: int = 8) -> List[str]:
+    """
+    Calculate perceptual hashes for several PIL Images at once.
+    
+    Produces the same hashes as calculate_image_phash (imagehash.phash), but
+    runs the DCT and median comparison for all images as single NumPy/SciPy
+    operations instead of once per image.
+    
+    Args:
+        images: PIL Image objects to hash
+        hash_size: Hash size in bits per side (default: 8, a 64-bit hash)
+        
+    Returns:
+        Perceptual hashes as hexadecimal strings, in the same order as ``images``
+        
+    Raises:
+        ImportError: If imagehash library (and its NumPy/SciPy dependencies) is not installed
+        RuntimeError: If hash calculation fails
+    """
+    try:
+        pixels = [image_phash_pixels(image, hash_size) for image in images]
+    except ImportError:
+        raise
+    except Exception as e:
+        raise RuntimeError(f"Error calculating perceptual hashes: {e}")
+    
+    return calculate_phashes_from_pixels(pixels, hash_size)
+
+
 def get_pdf_page_count(pdf_path: Union[str, pathlib.Path]) -> int:
     """
     Get the number of pages in a PDF document.
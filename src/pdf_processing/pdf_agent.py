@@ -6,9 +6,11 @@ multiple nodes for hash calculation, image extraction, URL extraction, and
 perceptual hashing.
 """
 
+import threading
 import time
 import pathlib
-from typing import Dict, Any, Optional, List
+from collections import OrderedDict
+from typing import Dict, Any, Optional, List, Tuple
 from pydantic import ValidationError
 
 from langgraph.graph import StateGraph, START, END
@@ -21,15 +23,16 @@ try:
         PDFProcessingOutput,
         PDFHashData,
         ExtractedImage,
-        ExtractedURL
+        URL_LIST_ADAPTER
     )
 
     from . import (
         calculate_file_hashes,
-        extract_pages_as_base64_images,
+        iter_pages_saved_with_sha1_filenames,
+        save_pages_with_sha1_filenames_parallel,
+        PARALLEL_RENDER_MIN_PAGES,
         extract_first_page_as_pil,
-        save_image_with_sha1_filename,
-        calculate_image_phash,
+        calculate_phashes_from_pixels,
         get_pdf_page_count,
         extract_urls_from_pdf,
         validate_pdf_path,
@@ -47,15 +50,16 @@ except ImportError:
         PDFProcessingOutput,
         PDFHashData,
         ExtractedImage,
-        ExtractedURL
+        URL_LIST_ADAPTER
     )
 
     from pdf_processing import (
         calculate_file_hashes,
-        extract_pages_as_base64_images,
+        iter_pages_saved_with_sha1_filenames,
+        save_pages_with_sha1_filenames_parallel,
+        PARALLEL_RENDER_MIN_PAGES,
         extract_first_page_as_pil,
-        save_image_with_sha1_filename,
-        calculate_image_phash,
+        calculate_phashes_from_pixels,
         get_pdf_page_count,
         extract_urls_from_pdf,
         validate_pdf_path,
@@ -84,7 +88,6 @@ def validation_node(state: PDFProcessingState) -> Dict[str, Any]:
         # Handle output directory - auto-generate if None (for LangGraph Studio usage)
         output_directory = state.get("output_directory")
         if output_directory is None or output_directory == "":
-            import time
             timestamp = int(time.time())
             output_directory = f"./extracted_images_{timestamp}"
             print(f"Auto-generated output directory: {output_directory}")
@@ -93,14 +96,16 @@ def validation_node(state: PDFProcessingState) -> Dict[str, Any]:
         output_dir = pathlib.Path(output_directory)
         ensure_output_directory(output_dir)
         
-        # Calculate file hashes
-        hashes = calculate_file_hashes(pdf_path)
-        
-        # Create hash data
-        pdf_hash = PDFHashData(
-            sha1=hashes["sha1"],
-            md5=hashes["md5"]
-        )
+        # Calculate file hashes, unless the caller already hashed the file
+        pdf_hash = state.get("pdf_hash")
+        if pdf_hash is None:
+            hashes = calculate_file_hashes(pdf_path)
+            
+            # Create hash data
+            pdf_hash = PDFHashData.from_hexdigest(
+                sha1=hashes["sha1"],
+                md5=hashes["md5"]
+            )
         
         # Get page count
         page_count = get_pdf_page_count(pdf_path)
@@ -144,7 +149,7 @@ def validation_node(state: PDFProcessingState) -> Dict[str, Any]:
 
 def image_extraction_node(state: PDFProcessingState) -> Dict[str, Any]:
     """
-    Node for extracting images from PDF pages, converting to base64, 
+    Node for rendering PDF pages as images,
     calculating phash, and saving with SHA1 filenames.
     
     Args:
@@ -162,6 +167,7 @@ def image_extraction_node(state: PDFProcessingState) -> Dict[str, Any]:
             raise ValueError("output_directory is None in state - auto-generation failed")
         
         output_dir = pathlib.Path(output_directory)
+        output_format = state.get("output_format") or "png"
         
         # Determine pages to process
         pages_to_process = state.get("pages_to_process")
@@ -172,59 +178,91 @@ def image_extraction_node(state: PDFProcessingState) -> Dict[str, Any]:
                 raise ValueError("Page count not available from validation node")
             pages_to_process = list(range(page_count))
         
-        # Extract images as base64
-        base64_images = extract_pages_as_base64_images(
-            pdf_path=pdf_path,
-            pages=pages_to_process,
-            dpi=150,
-            format="PNG"
-        )
+        # Render, save and reduce each page to its phash array; long page ranges
+        # are handed to worker processes, which return only the page records.
+        # pages_to_process is only a page list if validation succeeded;
+        # otherwise the renderer reports why
+        if isinstance(pages_to_process, list) and len(pages_to_process) >= PARALLEL_RENDER_MIN_PAGES:
+            saved_pages = save_pages_with_sha1_filenames_parallel(
+                pdf_path=pdf_path,
+                output_dir=output_dir,
+                pages=pages_to_process,
+                dpi=150,
+                format=output_format
+            )
+        else:
+            saved_pages = iter_pages_saved_with_sha1_filenames(
+                pdf_path=pdf_path,
+                output_dir=output_dir,
+                pages=pages_to_process,
+                dpi=150,
+                format=output_format
+            )
         
-        extracted_images = []
+        saved_images = []
+        unique_images = []
+        phash_failures = []
+        # Pixel SHA1 -> index into unique_images. Pages that render identically
+        # (blank pages, repeated covers) share the saved file and phash
+        seen_images: Dict[bytes, int] = {}
         
-        for img_data in base64_images:
-            try:
-                # Convert base64 back to PIL image for phash calculation and saving
-                import base64
-                from PIL import Image
-                import io
-                
-                img_bytes = base64.b64decode(img_data["base64_data"])
-                pil_image = Image.open(io.BytesIO(img_bytes))
-                
-                # Calculate perceptual hash
-                phash = calculate_image_phash(pil_image)
-                
-                # Save image with SHA1 filename
-                saved_path = save_image_with_sha1_filename(
-                    image=pil_image,
-                    output_dir=output_dir,
-                    format="PNG"
-                )
-                
-                # Extract SHA1 from saved path filename
-                image_sha1 = pathlib.Path(saved_path).stem
-                
-                # Create extracted image object
-                extracted_image = ExtractedImage(
-                    page_number=img_data["page_number"],
-                    base64_data=img_data["base64_data"],
-                    format=img_data["format"],
-                    phash=phash,
-                    saved_path=saved_path,
-                    image_sha1=image_sha1
-                )
-                
-                extracted_images.append(extracted_image)
-                
-            except Exception as e:
+        for page in saved_pages:
+            if "error" in page:
                 # Log error but continue with other images
-                error_msg = f"Error processing image for page {img_data['page_number']}: {str(e)}"
-                print(f"Warning: {error_msg}")
+                print(f"Warning: Error processing image for page {page['page_number']}: {page['error']}")
+                continue
+            
+            image_index = seen_images.get(page["pixel_sha1"])
+            if image_index is None:
+                if page["phash_pixels"] is None:
+                    phash_failures.append((page["page_number"], page["phash_error"]))
+                
+                image_index = len(unique_images)
+                unique_images.append((page["phash_pixels"], page["saved_path"]))
+                seen_images[page["pixel_sha1"]] = image_index
+            
+            saved_images.append((page["page_number"], image_index))
+        
+        # Calculate the perceptual hashes of all distinct saved images in one batch.
+        # If hashing fails the images are still reported, just without a phash
+        errors = []
+        if phash_failures:
+            page_number, phash_error = phash_failures[0]
+            error_msg = f"Error calculating perceptual hashes for {len(phash_failures)} page(s), first page {page_number}: {phash_error}"
+            print(f"Warning: {error_msg}")
+            errors.append(error_msg)
+        
+        phashes = [None] * len(unique_images)
+        hashable = [index for index, (phash_pixels, _) in enumerate(unique_images) if phash_pixels is not None]
+        try:
+            batch = calculate_phashes_from_pixels([unique_images[index][0] for index in hashable])
+            for index, phash in zip(hashable, batch):
+                phashes[index] = phash
+        except Exception as e:
+            error_msg = f"Error calculating perceptual hashes: {str(e)}"
+            print(f"Warning: {error_msg}")
+            errors.append(error_msg)
+        
+        # Create extracted image objects; SHA1 comes from the saved path filename.
+        # The saved file is the image data, so it is not also kept inline as
+        # base64 (ExtractedImage.get_base64_data() reads it back when needed)
+        extracted_images = [
+            ExtractedImage(
+                page_number=page_number,
+                format=output_format,
+                phash=phashes[image_index],
+                saved_path=unique_images[image_index][1],
+                image_sha1=pathlib.Path(unique_images[image_index][1]).stem
+            )
+            for page_number, image_index in saved_images
+        ]
         
-        return {
+        result = {
             "extracted_images": extracted_images
         }
+        if errors:
+            result["errors"] = errors
+        return result
         
     except Exception as e:
         error_msg = f"Error in image_extraction: {str(e)}"
@@ -272,17 +310,17 @@ def url_extraction_node(state: PDFProcessingState) -> Dict[str, Any]:
             print(f"Warning: URL extraction failed: {e}")
             url_data = []
         
-        # Convert to ExtractedURL objects
-        extracted_urls = []
-        for url_dict in url_data:
-            extracted_url = ExtractedURL(
-                url=url_dict["url"],
-                page_number=url_dict["page_number"],
-                url_type=url_dict["type"],
-                coordinates=url_dict.get("coordinates"),
-                is_external=url_dict.get("is_external")
-            )
-            extracted_urls.append(extracted_url)
+        # Convert to ExtractedURL objects, validating the whole list in one call
+        extracted_urls = URL_LIST_ADAPTER.validate_python([
+            {
+                "url": url_dict["url"],
+                "page_number": url_dict["page_number"],
+                "url_type": url_dict["type"],
+                "coordinates": url_dict.get("coordinates"),
+                "is_external": url_dict.get("is_external")
+            }
+            for url_dict in url_data
+        ])
         
         return {
             "extracted_urls": extracted_urls
@@ -323,8 +361,9 @@ def aggregation_node(state: PDFProcessingState) -> PDFProcessingOutput:
                 errors.append("Page count determination was not completed")
                 success = False
         
-        # Create the final output using the PDFProcessingOutput schema
-        return PDFProcessingOutput(
+        # Create the final output using the PDFProcessingOutput schema; every
+        # value was validated by the node that produced it
+        return PDFProcessingOutput.build_trusted(
             success=success,
             pdf_path=state["pdf_path"],
             pdf_hash=state.get("pdf_hash"),
@@ -390,61 +429,117 @@ def create_pdf_processing_graph() -> StateGraph:
     return builder.compile()
 
 
-def process_pdf_with_agent(
-    input_data: PDFProcessingInput
-) -> PDFProcessingOutput:
+def _apply_update(state: Dict[str, Any], update: Dict[str, Any]) -> None:
+    """Merge a node's update into state the way PDFProcessingState's reducers do."""
+    for key, value in update.items():
+        if key == "errors":
+            state["errors"] = state["errors"] + value
+        else:
+            state[key] = value
+
+
+def _run_nodes_inline(state: Dict[str, Any]) -> PDFProcessingOutput:
     """
-    Process a PDF using the LangGraph agent with parallel processing.
+    Run the processing nodes in order in the calling thread, without building
+    or invoking the graph.
     
-    Args:
-        input_data: PDFProcessingInput with validated input parameters
-        
-    Returns:
-        PDFProcessingOutput with all processing results
-        
-    Example:
-        >>> from pdf_processing.agent_schemas import PDFProcessingInput
-        >>> input_data = PDFProcessingInput(
-        ...     pdf_path="document.pdf",
-        ...     pages_to_process=3,  # Process first 3 pages
-        ...     output_directory="./my_images"
-        ... )
-        >>> result = process_pdf_with_agent(input_data)
-        >>> print(f"Processed {len(result.extracted_images)} images")
-        >>> print(f"Found {len(result.extracted_urls)} URLs")
+    Used for single-page runs (the default), where there is nothing to gain from
+    running image and URL extraction in parallel and the graph's compile and
+    state bookkeeping are a noticeable share of the run time.
     """
-    # Input is already validated as PDFProcessingInput by function signature
-    # No need for additional validation
-    
-    # Create the processing graph
-    graph = create_pdf_processing_graph()
+    _apply_update(state, validation_node(state))
+    _apply_update(state, image_extraction_node(state))
+    _apply_update(state, url_extraction_node(state))
+    return aggregation_node(state)
+
+
+# Successful results of recent runs, keyed by (resolved PDF path, PDF SHA1,
+# pages_to_process, output_directory, output_format). Running the agent again
+# on the same file returns the cached result instead of rendering and saving
+# every page again; the path is part of the key because results carry it.
+PROCESSING_CACHE_SIZE = 64
+
+ProcessingCacheKey = Tuple[str, str, Optional[int], Optional[str], str]
+
+_processing_cache: "OrderedDict[ProcessingCacheKey, PDFProcessingOutput]" = OrderedDict()
+_processing_cache_lock = threading.Lock()
+
+
+def clear_processing_cache() -> None:
+    """Drop all results cached by process_pdf_with_agent / aprocess_pdf_with_agent."""
+    with _processing_cache_lock:
+        _processing_cache.clear()
+
+
+def _hash_input_pdf(input_data: PDFProcessingInput) -> Optional[PDFHashData]:
+    """Hash the input PDF for the cache key, or None if it cannot be read."""
+    try:
+        hashes = calculate_file_hashes(input_data.pdf_path)
+    except Exception:
+        # Let the validation node report the unreadable file
+        return None
+    return PDFHashData.from_hexdigest(sha1=hashes["sha1"], md5=hashes["md5"])
+
+
+def _processing_cache_key(input_data: PDFProcessingInput, pdf_hash: Optional[PDFHashData]) -> Optional[ProcessingCacheKey]:
+    """Build the result cache key for a run, or None if the PDF could not be hashed."""
+    if pdf_hash is None:
+        return None
+    return (
+        str(pathlib.Path(input_data.pdf_path).resolve()),
+        pdf_hash.sha1,
+        input_data.pages_to_process,
+        input_data.output_directory,
+        input_data.output_format
+    )
+
+
+def _cached_result(key: ProcessingCacheKey) -> Optional[PDFProcessingOutput]:
+    """Return a copy of the cached result for key, if its saved images still exist."""
+    with _processing_cache_lock:
+        result = _processing_cache.get(key)
+        if result is None:
+            return None
+        _processing_cache.move_to_end(key)
     
-    # Convert PDFProcessingInput to internal PDFProcessingState format
+    if not all(pathlib.Path(image.saved_path).exists() for image in result.extracted_images if image.saved_path):
+        return None
+    return result.model_copy(deep=True)
+
+
+def _cache_result(key: ProcessingCacheKey, result: PDFProcessingOutput) -> None:
+    """Store a successful result, evicting the least recently used beyond PROCESSING_CACHE_SIZE."""
+    if not result.success:
+        return
+    with _processing_cache_lock:
+        _processing_cache[key] = result.model_copy(deep=True)
+        _processing_cache.move_to_end(key)
+        while len(_processing_cache) > PROCESSING_CACHE_SIZE:
+            _processing_cache.popitem(last=False)
+
+
+def _initial_state(input_data: PDFProcessingInput, pdf_hash: Optional[PDFHashData] = None) -> Dict[str, Any]:
+    """Convert PDFProcessingInput to the internal PDFProcessingState format."""
     # Note: pages_to_process conversion will happen in validation_node
-    initial_state = {
+    return {
         "pdf_path": input_data.pdf_path,
         "pages_to_process": input_data.pages_to_process,  # Will be converted in validation_node
         "output_directory": input_data.output_directory,
-        "pdf_hash": None,
+        "output_format": input_data.output_format,
+        "pdf_hash": pdf_hash,
         "page_count": None,
         "extracted_images": [],
         "extracted_urls": [],
         "errors": []
     }
-    
-    # Execute the graph with manual state conversion
-    start_time = time.time()
-    final_state = graph.invoke(initial_state)
-    total_time = time.time() - start_time
-    
-    # Convert final state to PDFProcessingOutput
+
+
+def _finalize_result(input_data: PDFProcessingInput, final_state: Any, total_time: float) -> PDFProcessingOutput:
+    """Attach the processing time to the graph result."""
     # The aggregation node already returns a PDFProcessingOutput, but we need to update the time
     if isinstance(final_state, PDFProcessingOutput):
         # Update the processing time
-        return PDFProcessingOutput(
-            **final_state.model_dump(),
-            total_processing_time=total_time
-        )
+        return final_state.model_copy(update={"total_processing_time": total_time})
     else:
         # Fallback: manually create output from state dict
         errors = final_state.get("errors", [])
@@ -462,6 +557,102 @@ def process_pdf_with_agent(
         )
 
 
+def process_pdf_with_agent(
+    input_data: PDFProcessingInput,
+    use_cache: bool = True
+) -> PDFProcessingOutput:
+    """
+    Process a PDF using the LangGraph agent with parallel processing.
+    
+    Successful results are kept in an in-process LRU cache keyed by the PDF's
+    path and contents, pages_to_process, output_directory and output_format, so
+    processing the same file again returns a copy of the earlier result.
+    Single-page runs call the nodes directly instead of invoking the graph; the
+    result is the same.
+    
+    Args:
+        input_data: PDFProcessingInput with validated input parameters
+        use_cache: Reuse (and store) cached results (default: True)
+        
+    Returns:
+        PDFProcessingOutput with all processing results
+        
+    Example:
+        >>> from pdf_processing.agent_schemas import PDFProcessingInput
+        >>> input_data = PDFProcessingInput(
+        ...     pdf_path="document.pdf",
+        ...     pages_to_process=3,  # Process first 3 pages
+        ...     output_directory="./my_images"
+        ... )
+        >>> result = process_pdf_with_agent(input_data)
+        >>> print(f"Processed {len(result.extracted_images)} images")
+        >>> print(f"Found {len(result.extracted_urls)} URLs")
+    """
+    # Input is already validated as PDFProcessingInput by function signature
+    # No need for additional validation
+    
+    # The hashes double as the cache key and are handed to the validation node
+    pdf_hash = _hash_input_pdf(input_data) if use_cache else None
+    cache_key = _processing_cache_key(input_data, pdf_hash)
+    if cache_key and (cached := _cached_result(cache_key)):
+        return cached
+    
+    start_time = time.perf_counter()
+    if input_data.pages_to_process == 1:
+        # A single page gains nothing from the parallel branches; skip the graph
+        final_state = _run_nodes_inline(_initial_state(input_data, pdf_hash))
+    else:
+        # Create the processing graph
+        graph = create_pdf_processing_graph()
+        
+        # Execute the graph with manual state conversion
+        final_state = graph.invoke(_initial_state(input_data, pdf_hash))
+    total_time = time.perf_counter() - start_time
+    
+    result = _finalize_result(input_data, final_state, total_time)
+    if cache_key:
+        _cache_result(cache_key, result)
+    return result
+
+
+async def aprocess_pdf_with_agent(
+    input_data: PDFProcessingInput,
+    use_cache: bool = True
+) -> PDFProcessingOutput:
+    """
+    Async version of process_pdf_with_agent for callers already on an event loop.
+    
+    The graph runs with ainvoke, so the image and URL extraction nodes run
+    in LangGraph's executor without blocking the loop, and other coroutines
+    (e.g. several PDFs processed with asyncio.gather) make progress meanwhile.
+    
+    Args:
+        input_data: PDFProcessingInput with validated input parameters
+        use_cache: Reuse (and store) cached results (default: True)
+        
+    Returns:
+        PDFProcessingOutput with all processing results
+        
+    Example:
+        >>> result = await aprocess_pdf_with_agent(PDFProcessingInput(pdf_path="document.pdf"))
+    """
+    pdf_hash = _hash_input_pdf(input_data) if use_cache else None
+    cache_key = _processing_cache_key(input_data, pdf_hash)
+    if cache_key and (cached := _cached_result(cache_key)):
+        return cached
+    
+    graph = create_pdf_processing_graph()
+    
+    start_time = time.perf_counter()
+    final_state = await graph.ainvoke(_initial_state(input_data, pdf_hash))
+    total_time = time.perf_counter() - start_time
+    
+    result = _finalize_result(input_data, final_state, total_time)
+    if cache_key:
+        _cache_result(cache_key, result)
+    return result
+
+
 # Backward compatibility wrapper
 def process_pdf_with_agent_legacy(
     pdf_path: str,
@@ -575,7 +766,7 @@ def main():
                 print(f"  Perceptual Hash: {img.phash}")
                 print(f"  Saved to: {img.saved_path}")
                 print(f"  Image SHA1: {img.image_sha1}")
-                print(f"  Base64 length: {len(img.base64_data)} chars")
+                print(f"  Base64 length: {len(img.get_base64_data())} chars")
         
         if result.extracted_urls:
             print(f"\n=== URL Details ===")
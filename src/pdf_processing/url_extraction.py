@@ -131,6 +131,18 @@ class PDFURLExtractor:
         re.VERBOSE
     )
     
+    # Patterns used per candidate URL, compiled once with URL_PATTERN
+    TRAILING_PUNCTUATION_PATTERN = re.compile(r'[.,;:!?]+$')
+    HTTP_SCHEME_PATTERN = re.compile(r'^https?://', re.IGNORECASE)
+    BARE_DOMAIN_PATTERN = re.compile(r'^[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?\.')
+    VALID_URL_PATTERN = re.compile(
+        r'^https?://'  # Protocol
+        r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # Domain
+        r'localhost|'  # localhost
+        r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # IP
+        r'(?::\d+)?'  # Optional port
+        r'(?:/?|[/?]\S+)$', re.IGNORECASE)
+    
     def __init__(self, min_url_length: int = 4, max_url_length: int = 2048):
         """
         Initialize the URL extractor.
@@ -322,13 +334,13 @@ class PDFURLExtractor:
             Cleaned URL string
         """
         # Remove trailing punctuation that's not part of URL
-        url = re.sub(r'[.,;:!?]+$', '', url)
+        url = self.TRAILING_PUNCTUATION_PATTERN.sub('', url)
         
         # Add protocol if missing
-        if not re.match(r'^https?://', url, re.IGNORECASE):
+        if not self.HTTP_SCHEME_PATTERN.match(url):
             if url.startswith('www.'):
                 url = 'http://' + url
-            elif re.match(r'^[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?\.', url):
+            elif self.BARE_DOMAIN_PATTERN.match(url):
                 url = 'http://' + url
         
         return url
@@ -347,15 +359,7 @@ class PDFURLExtractor:
             return False
         
         # Basic URL validation
-        url_pattern = re.compile(
-            r'^https?://'  # Protocol
-            r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # Domain
-            r'localhost|'  # localhost
-            r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # IP
-            r'(?::\d+)?'  # Optional port
-            r'(?:/?|[/?]\S+)$', re.IGNORECASE)
-        
-        return bool(url_pattern.match(url))
+        return bool(self.VALID_URL_PATTERN.match(url))
     
     def _deduplicate_urls(self, urls: List[URLMatch]) -> List[URLMatch]:
         """
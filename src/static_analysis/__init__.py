@@ -4,7 +4,8 @@ Static Analysis Module for PDF Forensic Analysis
 This module provides LangGraph-based forensic analysis of PDF files with structured input/output schemas.
 """
 
-from .graph import app, create_app, process_pdf_with_forensic_agent
+import importlib
+
 from .schemas import (
     ForensicCaseFileInput, 
     ForensicCaseFileOutput, 
@@ -23,3 +24,18 @@ __all__ = [
     "Verdict",
     "AnalysisPhase"
 ]
+
+
+# The graph (and the LLM / tool stack behind it) is imported on first access,
+# so importing the schemas does not build the forensic agent
+_LAZY_IMPORTS = {
+    "app": ".graph",
+    "create_app": ".graph",
+    "process_pdf_with_forensic_agent": ".graph",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        return getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -15,6 +15,7 @@ from static_analysis.prompts import (
     ANALYST_HUMAN_PROMPT, STRATEGIC_REVIEW_HUMAN_PROMPT, TOOL_MANIFEST
 )
 from static_analysis.utils import create_llm_chain, run_pdfid, run_pdf_parser_full_statistical_analysis, ToolExecutor
+from pdf_processing.hashing import calculate_file_hashes
 
 from config import STATIC_ANALYSIS_ANALYST_LLM, STATIC_ANALYSIS_TRIAGE_LLM, STATIC_ANALYSIS_TECHNICIAN_LLM, STATIC_ANALYSIS_STRATEGIC_REVIEW_LLM
 
@@ -26,6 +27,7 @@ tool_executor = ToolExecutor(manifest=TOOL_MANIFEST)
 
 # --- CONFIGURATION ---
 MAX_INTERROGATION_STEPS = 15 # Circuit breaker for infinite loops
+EARLY_FINALIZE_COHERENCE_SCORE = 0.1 # Stop interrogating a Malicious file once its coherence drops this low (0.0 = deceptive)
 
 
 
@@ -35,11 +37,19 @@ def triage_node(state: ForensicCaseFile) -> Dict[str, Any]:
     starting hypothesis and investigation plan.
     """
     print("\n--- Running Triage Node ---")
+    # Callers like the PDF Hunter pass the hash they already calculated
+    file_hash_sha256 = state.file_hash_sha256
+    if not file_hash_sha256:
+        try:
+            file_hash_sha256 = calculate_file_hashes(state.file_path, algorithms=("sha256",))["sha256"]
+        except (OSError, ValueError) as e:
+            print(f"[!] Could not hash {state.file_path}: {e}")
+
     pdfid_output = run_pdfid(state.file_path)
     stats_output = run_pdf_parser_full_statistical_analysis(state.file_path)
     triage_context = f"--- PDFID ANALYSIS ---\n{pdfid_output}\n\n--- STATISTICAL ANALYSIS ---\n{stats_output}"
     print(f"[*] Combined Triage Output:\n{triage_context}")
-    chain = create_llm_chain(SYSTEM_PROMPT, TRIAGE_HUMAN_PROMPT, TriageAnalysis, STATIC_ANALYSIS_TRIAGE_LLM)
+    chain = create_llm_chain(SYSTEM_PROMPT, TRIAGE_HUMAN_PROMPT, TriageAnalysis, STATIC_ANALYSIS_TRIAGE_LLM())
 
     print("[*] Dr. Reed is performing initial triage...")
     llm_response = chain.invoke({"triage_context": triage_context})
@@ -68,6 +78,7 @@ def triage_node(state: ForensicCaseFile) -> Dict[str, Any]:
     }
     
     return {
+        "file_hash_sha256": file_hash_sha256,
         "verdict": llm_response.verdict,
         "phase": llm_response.phase,
         "current_hypothesis": llm_response.hypothesis,
@@ -94,7 +105,7 @@ def interrogation_node(state: ForensicCaseFile) -> Dict[str, Any]:
     task_lookahead = state.investigation_queue[:10]
     
     print("[*] Dr. Reed is in instrumental mode (selecting task and tool)...")
-    technician_chain = create_llm_chain(SYSTEM_PROMPT, TECHNICIAN_HUMAN_PROMPT, ToolAndTaskSelection, STATIC_ANALYSIS_TECHNICIAN_LLM)
+    technician_chain = create_llm_chain(SYSTEM_PROMPT, TECHNICIAN_HUMAN_PROMPT, ToolAndTaskSelection, STATIC_ANALYSIS_TECHNICIAN_LLM())
     
     # This invoke call is now correct and includes the evidence_locker
     tool_selection = technician_chain.invoke({
@@ -114,7 +125,7 @@ def interrogation_node(state: ForensicCaseFile) -> Dict[str, Any]:
     print(f"[*] Tool Output:\nSTDOUT: {tool_log_entry.stdout}\nSTDERR: {tool_log_entry.stderr}")
 
     print("[*] Dr. Reed is in analytical mode (interpreting tool output)...")
-    analyst_chain = create_llm_chain(SYSTEM_PROMPT, ANALYST_HUMAN_PROMPT, InterrogationAnalysis, STATIC_ANALYSIS_ANALYST_LLM)
+    analyst_chain = create_llm_chain(SYSTEM_PROMPT, ANALYST_HUMAN_PROMPT, InterrogationAnalysis, STATIC_ANALYSIS_ANALYST_LLM())
     
     analysis = analyst_chain.invoke({
         "hypothesis": state.current_hypothesis,
@@ -148,8 +159,14 @@ def interrogation_node(state: ForensicCaseFile) -> Dict[str, Any]:
     # Add any new attack chain links
     updated_evidence.attack_chain.extend(analysis.attack_chain_additions)
     
-    # Add any new Indicators of Compromise
-    updated_evidence.indicators_of_compromise.extend(analysis.new_indicators_of_compromise)
+    # Add any new Indicators of Compromise, skipping ones already on record
+    # (the analyst often re-reports an IoC when it revisits the same object)
+    known_iocs = {(ioc.value, ioc.source_object_id) for ioc in updated_evidence.indicators_of_compromise}
+    for ioc in analysis.new_indicators_of_compromise:
+        ioc_key = (ioc.value, ioc.source_object_id)
+        if ioc_key not in known_iocs:
+            known_iocs.add(ioc_key)
+            updated_evidence.indicators_of_compromise.append(ioc)
     
     # The analyst now returns a dictionary of artifacts keyed by their new artifact_id.
     # We iterate through this dictionary to add them to the evidence locker.
@@ -186,7 +203,7 @@ def strategic_review_node(state: ForensicCaseFile) -> Dict[str, Any]:
         return {}
 
     print("[*] Dr. Reed is reviewing the overall strategy...")
-    review_chain = create_llm_chain(SYSTEM_PROMPT, STRATEGIC_REVIEW_HUMAN_PROMPT, StrategicReview, STATIC_ANALYSIS_STRATEGIC_REVIEW_LLM)
+    review_chain = create_llm_chain(SYSTEM_PROMPT, STRATEGIC_REVIEW_HUMAN_PROMPT, StrategicReview, STATIC_ANALYSIS_STRATEGIC_REVIEW_LLM())
     
     review = review_chain.invoke({
         "hypothesis": state.current_hypothesis,
@@ -228,6 +245,11 @@ def conditional_router(state: ForensicCaseFile) -> str:
         print(f"[*] Decision: Max interrogation steps ({MAX_INTERROGATION_STEPS}) reached. Finalizing.")
         return "finalize"
 
+    # Early exit: further rounds cannot change a confident Malicious verdict
+    if state.verdict == Verdict.MALICIOUS and state.narrative_coherence.score <= EARLY_FINALIZE_COHERENCE_SCORE:
+        print(f"[*] Decision: Malicious with coherence score {state.narrative_coherence.score}. Finalizing early.")
+        return "finalize"
+
     if not state.investigation_queue:
         print("[*] Decision: Investigation complete.")
         return "finalize" # We will add reassessment logic here later
@@ -315,7 +337,8 @@ def convert_to_output_schema(state: ForensicCaseFile) -> ForensicCaseFileOutput:
     """
     print(f"[*] Converting state with {len(state.evidence.indicators_of_compromise)} IoCs and {len(state.evidence.attack_chain)} attack chain links")
     
-    output = ForensicCaseFileOutput(
+    # Every field comes from the validated state, so skip re-validation
+    output = ForensicCaseFileOutput.model_construct(
         success=len(state.errors) == 0,
         file_path=state.file_path,
         file_hash_sha256=state.file_hash_sha256,
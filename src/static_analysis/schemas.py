@@ -34,7 +34,7 @@ class InvestigationTask(BaseModel):
     context_data: Optional[str] = Field(None, description="Contextual data for tasks not related to a specific artifact (e.g., a keyword search).")
 
 class NarrativeCoherence(BaseModel):
-    score: float = Field(1.0, description="Incoherence score from 0.0 (coherent) to 1.0 (deceptive).")
+    score: float = Field(1.0, description="Coherence score from 0.0 (highly deceptive) to 1.0 (coherent).")
     notes: List[str] = Field(default_factory=list, description="Observations that affect coherence.")
 
 class AttackChainLink(BaseModel):
@@ -65,6 +65,7 @@ class EvidenceLocker(BaseModel):
 class ForensicCaseFileInput(BaseModel):
     """Input model for the Forensic Analysis Agent."""
     file_path: str = Field(..., description="The local path to the PDF file to be analyzed.")
+    file_hash_sha256: Optional[str] = Field(None, description="SHA256 hash of the file, if already calculated by the caller.")
 
 
 class ToolCallLog(BaseModel):
@@ -6,7 +6,6 @@ import os
 import sys
 from pydantic import BaseModel
 from langchain_core.prompts import ChatPromptTemplate, SystemMessagePromptTemplate, HumanMessagePromptTemplate
-from langchain_openai import ChatOpenAI
 from langchain_core.output_parsers import PydanticOutputParser
 
 
@@ -18,7 +17,6 @@ import base64
 from typing import List, Dict, Any
 from pydantic import BaseModel
 from langchain_core.prompts import ChatPromptTemplate, SystemMessagePromptTemplate, HumanMessagePromptTemplate
-from langchain_openai import ChatOpenAI
 from langchain_core.output_parsers import PydanticOutputParser
 
 from static_analysis.schemas import ToolCallLog
@@ -26,6 +26,7 @@ from visual_analysis.schemas import (
     DetailedFinding, PrioritizedURL
 )
 from visual_analysis.prompts import SYSTEM_PROMPT
+from visual_analysis.utils import create_llm_chain, analyze_page_image
 
 # Import centralized LLM configuration
 from config import VISUAL_ANALYSIS_ANALYST_LLM
@@ -140,9 +141,6 @@ def visual_analysis_node(state: VisualAnalysisState) -> Dict[str, Any]:
     if not extracted_images:
         return {"errors": ["No images available for visual analysis"]}
     
-    # Import utils here to avoid circular imports
-    from visual_analysis.utils import create_llm_chain, analyze_page_image
-    
     page_analyses = []
     
     # Group images by page and analyze each page
@@ -171,7 +169,7 @@ def visual_analysis_node(state: VisualAnalysisState) -> Dict[str, Any]:
             page_analysis = analyze_page_image(
                 image=main_image,
                 element_map=element_map,
-                llm=VISUAL_ANALYSIS_ANALYST_LLM
+                llm=VISUAL_ANALYSIS_ANALYST_LLM()
             )
             
             page_analyses.append(page_analysis)
@@ -366,7 +364,7 @@ def process_pdf_with_visual_agent(input_data: VisualAnalysisInput) -> VisualAnal
     print(f"[*] Starting visual analysis with input: {input_data.model_dump()}")
     
     # Record start time
-    start_time = time.time()
+    start_time = time.perf_counter()
     
     # Create the processing graph
     graph = create_app()
@@ -376,7 +374,7 @@ def process_pdf_with_visual_agent(input_data: VisualAnalysisInput) -> VisualAnal
         final_result = graph.invoke(input_data.model_dump())
         
         # Calculate processing time
-        processing_time = time.time() - start_time
+        processing_time = time.perf_counter() - start_time
         
         # Extract the final output
         if isinstance(final_result, dict):
@@ -407,7 +405,7 @@ def process_pdf_with_visual_agent(input_data: VisualAnalysisInput) -> VisualAnal
             )
             
     except Exception as e:
-        processing_time = time.time() - start_time
+        processing_time = time.perf_counter() - start_time
         print(f"[!] Visual analysis failed: {str(e)}")
         
         return VisualAnalysisOutput(
@@ -12,7 +12,6 @@ deception tactics and social engineering attempts.
 
 import operator
 from typing import List, Dict, Optional, Literal, Any
-from pathlib import Path
 from pydantic import BaseModel, Field, field_validator
 from typing_extensions import Annotated, TypedDict
 
@@ -60,8 +59,7 @@ class VisualAnalysisInput(BaseModel):
             v = v.strip()
             if not v:
                 raise ValueError('PDF path cannot be empty')
-            path_obj = Path(v)
-            if path_obj.suffix.lower() != '.pdf':
+            if not v.lower().endswith('.pdf'):
                 raise ValueError('File must have .pdf extension')
         return v
     
@@ -21,6 +21,7 @@ from visual_analysis.schemas import (
     VisualAnalysisResults, ElementMap, DeceptionTactic, BenignSignal,
     DetailedFinding, PrioritizedURL
 )
+from visual_analysis.prompts import SYSTEM_PROMPT
 from pdf_processing.agent_schemas import ExtractedImage
 
 
@@ -55,16 +56,20 @@ def prepare_image_for_analysis(image: ExtractedImage) -> Optional[str]:
     Prepare an extracted image for visual analysis.
     
     Args:
-        image: ExtractedImage object with base64 data
+        image: ExtractedImage object with base64 data, or a saved_path to load it from
         
     Returns:
         Base64 image data formatted for LLM analysis, or None if invalid
     """
     try:
         # Handle both dict and object formats
-        base64_data = image["base64_data"] if isinstance(image, dict) else image.base64_data
-        page_number = image["page_number"] if isinstance(image, dict) else image.page_number
-        format_type = image["format"] if isinstance(image, dict) else image.format
+        if isinstance(image, dict):
+            image = ExtractedImage.model_validate(image)
+        page_number = image.page_number
+        format_type = image.format
+        
+        # Images referenced by path are only read from disk here, when needed
+        base64_data = image.get_base64_data()
         
         # Validate that we have base64 data
         if not base64_data:
@@ -147,9 +152,6 @@ def analyze_page_image(image: ExtractedImage, element_map: Optional[ElementMap],
         # Create element map JSON
         element_map_json = create_element_map_json(element_map)
         
-        # Import the system prompt
-        from visual_analysis.prompts import SYSTEM_PROMPT
-        
         # Create the human prompt for this specific analysis
         human_prompt = """
         I need you to analyze this PDF page for visual deception tactics.